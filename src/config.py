@@ -3,8 +3,8 @@ Configuration management for the Polymarket In-Efficiency Bot.
 """
 
 import os
-from typing import List, Optional
-from pydantic import Field
+from typing import Any, List, Optional
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings
 from pathlib import Path
 
@@ -69,11 +69,24 @@ class Settings(BaseSettings):
         description="Chainlink XRP/USD price feed URL"
     )
 
+    # Bumped on every field assignment so dependents can detect changes
+    _generation: int = PrivateAttr(default=0)
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """Get the number of field assignments made since loading."""
+        return self._generation
+
     @property
     def admin_ids(self) -> List[int]:
         """Parse admin IDs from comma-separated string."""
@@ -305,7 +305,7 @@ class Orchestrator:
 
         # Stop components
         if self.strategy:
-            self.strategy.stop()
+            await self.strategy.shutdown()
 
         if self.market_monitor:
             self.market_monitor.stop()
@@ -325,6 +325,9 @@ class Orchestrator:
 
         logger.info("Bot stopped")
 
+        # Flush messages still queued for the log sinks
+        await logger.complete()
+
     async def run(self) -> None:
         """Run the bot (blocking)."""
         try:
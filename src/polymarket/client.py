@@ -351,7 +351,7 @@ class PolymarketClient:
             if outcome.token_id:
                 order_book = await self.fetch_order_book(outcome.token_id)
                 if order_book:
-                    outcome.order_book = order_book
+                    market.set_order_book(outcome, order_book)
 
         return market
 
@@ -7,6 +7,8 @@ from datetime import datetime
 from typing import Optional, List, Dict
 from enum import Enum
 
+from ..utils.clock import to_epoch_seconds
+
 
 class MarketType(Enum):
     """Type of prediction market."""
@@ -45,7 +47,7 @@ class PositionStatus(Enum):
     CLOSED = "closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookLevel:
     """Single level in the order book."""
     price: float
@@ -66,6 +68,11 @@ class OrderBook:
     bids: List[OrderBookLevel] = field(default_factory=list)
     asks: List[OrderBookLevel] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ts: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Epoch seconds for cheap lag arithmetic on the hot path
+        self.timestamp_ts = to_epoch_seconds(self.timestamp)
 
     @property
     def best_bid(self) -> Optional[OrderBookLevel]:
@@ -175,6 +182,41 @@ class Market:
     price_threshold: Optional[float] = None  # e.g., 100000 for "BTC above $100,000"
     threshold_type: Optional[str] = None  # "above", "below", "between"
 
+    # Derived-value cache, invalidated by bumping _ob_version
+    _ob_version: int = field(default=0, init=False, repr=False, compare=False)
+    _cache_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _cached_yes_outcome: Optional[MarketOutcome] = field(default=None, init=False, repr=False, compare=False)
+    _cached_implied_price: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
+    def set_order_book(self, outcome: MarketOutcome, order_book: OrderBook) -> None:
+        """Attach a fresh order book to an outcome and invalidate cached values."""
+        outcome.order_book = order_book
+        self._ob_version += 1
+
+    def mark_updated(self) -> None:
+        """Invalidate cached values after outcomes are modified directly."""
+        self._ob_version += 1
+
+    def _refresh_cache(self) -> None:
+        """Recompute cached Yes outcome and implied price."""
+        self._cached_yes_outcome = self.get_yes_outcome()
+        self._cached_implied_price = self.get_implied_price()
+        self._cache_version = self._ob_version
+
+    @property
+    def yes_outcome_cached(self) -> Optional[MarketOutcome]:
+        """Get the 'Yes' outcome, cached until the market is next updated."""
+        if self._cache_version != self._ob_version:
+            self._refresh_cache()
+        return self._cached_yes_outcome
+
+    @property
+    def implied_price_cached(self) -> Optional[float]:
+        """Get the implied price, cached until the market is next updated."""
+        if self._cache_version != self._ob_version:
+            self._refresh_cache()
+        return self._cached_implied_price
+
     def get_yes_outcome(self) -> Optional[MarketOutcome]:
         """Get the 'Yes' outcome."""
         for outcome in self.outcomes:
@@ -283,7 +325,7 @@ class Order:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """
     Open position in a market.
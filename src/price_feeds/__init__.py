@@ -2,8 +2,8 @@
 Price feed integrations for Chainlink oracle data.
 """
 
-from .chainlink_scraper import ChainlinkPriceScraper
+from .chainlink_scraper import ChainlinkPriceScraper, ChainlinkHTTPPoller
 from .price_manager import PriceManager
 from .models import PriceData, PriceFeed
 
-__all__ = ["ChainlinkPriceScraper", "PriceManager", "PriceData", "PriceFeed"]
+__all__ = ["ChainlinkPriceScraper", "ChainlinkHTTPPoller", "PriceManager", "PriceData", "PriceFeed"]
@@ -1,11 +1,14 @@
 """
-Chainlink price feed scraper using Selenium for real-time price data.
-Scrapes prices from data.chain.link website.
+Chainlink price feed sources.
+
+- ChainlinkHTTPPoller: batched JSON-RPC reads of the on-chain feeds (default)
+- ChainlinkPriceScraper: Selenium scraper for the data.chain.link website
+- ChainlinkOnChainReader: web3-based on-chain reader (backup)
 """
 
 import asyncio
 import re
-from datetime import datetime
+import aiohttp
 from typing import Dict, Optional, List
 from loguru import logger
 
@@ -18,6 +21,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
 from .models import PriceData, PriceSource
+from ..utils.clock import utcnow, ns_to_datetime
 
 
 class ChainlinkPriceScraper:
@@ -190,7 +194,7 @@ class ChainlinkPriceScraper:
                     price_data = PriceData(
                         symbol=symbol,
                         price=price,
-                        timestamp=datetime.utcnow(),
+                        timestamp=utcnow(),
                         source=PriceSource.CHAINLINK_SCRAPE,
                         confidence=0.95
                     )
@@ -372,14 +376,14 @@ class ChainlinkOnChainReader:
             _, answer, _, updated_at, _ = round_data
 
             price = answer / (10 ** decimals)
-            timestamp = datetime.utcfromtimestamp(updated_at)
 
             return PriceData(
                 symbol=symbol,
                 price=price,
-                timestamp=timestamp,
+                timestamp=utcnow(),
                 source=PriceSource.CHAINLINK_ONCHAIN,
-                confidence=1.0
+                confidence=1.0,
+                updated_at=ns_to_datetime(updated_at * 1_000_000_000)
             )
 
         except Exception as e:
@@ -396,3 +400,196 @@ class ChainlinkOnChainReader:
                 results[symbol] = price
 
         return results
+
+
+class ChainlinkHTTPPoller:
+    """
+    Polls Chainlink price feeds over plain HTTP JSON-RPC.
+
+    All feeds are read with a single batched eth_call request per poll, so
+    no browser or web3 provider is needed. Exposes the same interface as
+    ChainlinkPriceScraper so PriceManager can use either source.
+    """
+
+    # Function selectors for the Chainlink aggregator interface
+    LATEST_ROUND_DATA_SELECTOR = "0xfeaf968c"
+    DECIMALS_SELECTOR = "0x313ce567"
+
+    def __init__(self, rpc_url: str = "https://polygon-rpc.com", timeout_seconds: float = 5.0):
+        """
+        Initialize the poller.
+
+        Args:
+            rpc_url: Polygon RPC URL
+            timeout_seconds: Timeout for each RPC request
+        """
+        self.rpc_url = rpc_url
+        self.timeout_seconds = timeout_seconds
+        self.feeds: Dict[str, str] = ChainlinkOnChainReader.PRICE_FEEDS
+        self.decimals: Dict[str, int] = {}
+        self.last_prices: Dict[str, PriceData] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._running = False
+        self._callbacks: List[callable] = []
+
+    async def initialize(self) -> None:
+        """Create the HTTP session and read feed decimals."""
+        logger.info("Initializing Chainlink HTTP poller...")
+
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds)
+        )
+
+        results = await self._batch_call(self.DECIMALS_SELECTOR)
+        for symbol, result in results.items():
+            self.decimals[symbol] = int(result, 16)
+
+        missing = set(self.feeds) - set(self.decimals)
+        if missing:
+            raise ConnectionError(f"Failed to read decimals for {', '.join(sorted(missing))}")
+
+        logger.info(f"Connected to Polygon RPC: {self.rpc_url}")
+
+    async def close(self) -> None:
+        """Close the HTTP session."""
+        self._running = False
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    def add_callback(self, callback: callable) -> None:
+        """Add a callback to be called when new price data is available."""
+        self._callbacks.append(callback)
+
+    async def _batch_call(self, selector: str) -> Dict[str, str]:
+        """
+        Call a zero-argument function on every feed in one JSON-RPC batch.
+
+        Args:
+            selector: 4-byte function selector as hex string
+
+        Returns:
+            Dict mapping symbol to raw hex result
+        """
+        symbols = list(self.feeds.keys())
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_call",
+                "params": [{"to": self.feeds[symbol], "data": selector}, "latest"]
+            }
+            for i, symbol in enumerate(symbols)
+        ]
+
+        async with self._session.post(self.rpc_url, json=payload) as response:
+            response.raise_for_status()
+            replies = await response.json()
+
+        results = {}
+        for reply in replies:
+            index = reply.get("id")
+            if not isinstance(index, int) or not 0 <= index < len(symbols):
+                continue
+            symbol = symbols[index]
+            if "error" in reply:
+                logger.error(f"RPC error for {symbol}: {reply['error']}")
+                continue
+            results[symbol] = reply["result"]
+
+        return results
+
+    @staticmethod
+    def _decode_round_data(result: str) -> tuple[int, int, int]:
+        """
+        Decode a latestRoundData() result.
+
+        Returns:
+            Tuple of (round_id, answer, updated_at)
+        """
+        data = result[2:] if result.startswith("0x") else result
+        words = [int(data[i:i + 64], 16) for i in range(0, 5 * 64, 64)]
+
+        answer = words[1]
+        if answer >= 2 ** 255:
+            answer -= 2 ** 256
+
+        return words[0], answer, words[3]
+
+    async def scrape_all_prices(self) -> Dict[str, PriceData]:
+        """
+        Poll prices for all symbols.
+
+        Every poll returns all symbols stamped with the poll time, so a
+        price's timestamp is when its round was last confirmed current
+        even if the feed has not published a new round since.
+        """
+        try:
+            results = await self._batch_call(self.LATEST_ROUND_DATA_SELECTOR)
+        except Exception as e:
+            logger.error(f"Error polling Chainlink feeds: {e}")
+            return {}
+
+        prices = {}
+        for symbol, result in results.items():
+            try:
+                _, answer, updated_at = self._decode_round_data(result)
+            except ValueError as e:
+                logger.error(f"Could not decode round data for {symbol}: {e}")
+                continue
+
+            price_data = PriceData(
+                symbol=symbol,
+                price=answer / (10 ** self.decimals[symbol]),
+                timestamp=utcnow(),
+                source=PriceSource.CHAINLINK_ONCHAIN,
+                confidence=1.0,
+                updated_at=ns_to_datetime(updated_at * 1_000_000_000)
+            )
+            self.last_prices[symbol] = price_data
+            prices[symbol] = price_data
+
+        return prices
+
+    async def start_continuous_scraping(self, interval_seconds: float = 1.0) -> None:
+        """
+        Start continuous price polling.
+
+        Args:
+            interval_seconds: Time between polls
+        """
+        self._running = True
+
+        logger.info(f"Starting continuous polling with {interval_seconds}s interval")
+
+        while self._running:
+            try:
+                prices = await self.scrape_all_prices()
+
+                if prices:
+                    for callback in self._callbacks:
+                        try:
+                            if asyncio.iscoroutinefunction(callback):
+                                await callback(prices)
+                            else:
+                                callback(prices)
+                        except Exception as e:
+                            logger.error(f"Callback error: {e}")
+
+                await asyncio.sleep(interval_seconds)
+
+            except Exception as e:
+                logger.error(f"Error in continuous polling: {e}")
+                await asyncio.sleep(5)  # Wait longer on error
+
+    def stop(self) -> None:
+        """Stop continuous polling."""
+        self._running = False
+
+    def get_last_price(self, symbol: str) -> Optional[PriceData]:
+        """Get the last polled price for a symbol."""
+        return self.last_prices.get(symbol)
+
+    def get_all_last_prices(self) -> Dict[str, PriceData]:
+        """Get all last polled prices."""
+        return self.last_prices.copy()
@@ -5,18 +5,24 @@ Data models for price feeds.
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict
-from enum import Enum
+from enum import IntEnum
 
+from ..utils.clock import utcnow, to_epoch_seconds
 
-class PriceSource(Enum):
+
+class PriceSource(IntEnum):
     """Price data source identifier."""
-    CHAINLINK_SCRAPE = "chainlink_scrape"
-    CHAINLINK_ONCHAIN = "chainlink_onchain"
-    CHAINLINK_API = "chainlink_api"
-    POLYMARKET = "polymarket"
+    CHAINLINK_SCRAPE = 0
+    CHAINLINK_ONCHAIN = 1
+    CHAINLINK_API = 2
+    POLYMARKET = 3
 
 
-@dataclass
+# Serialized PriceSource names, indexed by member value
+_PRICE_SOURCE_STR = ("chainlink_scrape", "chainlink_onchain", "chainlink_api", "polymarket")
+
+
+@dataclass(slots=True)
 class PriceData:
     """
     Represents a single price data point.
@@ -30,11 +36,19 @@ class PriceData:
     change_24h_pct: Optional[float] = None
     high_24h: Optional[float] = None
     low_24h: Optional[float] = None
+    # Time the source published the value (e.g. a Chainlink round's updatedAt);
+    # timestamp is when it was observed here and is what lag is measured from
+    updated_at: Optional[datetime] = None
+    timestamp_ts: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Epoch seconds for cheap lag arithmetic on the hot path
+        self.timestamp_ts = to_epoch_seconds(self.timestamp)
 
     @property
     def age_seconds(self) -> float:
         """Get the age of this price data in seconds."""
-        return (datetime.utcnow() - self.timestamp).total_seconds()
+        return (utcnow() - self.timestamp).total_seconds()
 
     def is_stale(self, max_age_seconds: float = 30.0) -> bool:
         """Check if this price data is stale."""
@@ -46,12 +60,13 @@ class PriceData:
             "symbol": self.symbol,
             "price": self.price,
             "timestamp": self.timestamp.isoformat(),
-            "source": self.source.value,
+            "source": _PRICE_SOURCE_STR[self.source],
             "confidence": self.confidence,
             "volume_24h": self.volume_24h,
             "change_24h_pct": self.change_24h_pct,
             "high_24h": self.high_24h,
             "low_24h": self.low_24h,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "age_seconds": self.age_seconds
         }
 
@@ -67,13 +82,41 @@ class PriceFeed:
     max_history_size: int = 1000
 
     def update(self, price_data: PriceData) -> None:
-        """Update the feed with new price data."""
+        """
+        Update the feed with new price data.
+
+        A re-confirmation of the current source round (same updated_at and
+        price) replaces the last history entry instead of adding one, so
+        history holds one point per round.
+
+        History is trimmed back to max_history_size in place once it reaches
+        twice that size, so trimming cost is amortized across appends. Read
+        it through history or history_size, which cap it to the window.
+        """
+        previous = self.current_price
         self.current_price = price_data
+        if (
+            previous is not None and price_data.updated_at is not None and self.price_history
+            and previous.updated_at == price_data.updated_at and previous.price == price_data.price
+        ):
+            self.price_history[-1] = price_data
+            return
+
         self.price_history.append(price_data)
 
         # Trim history if needed
-        if len(self.price_history) > self.max_history_size:
-            self.price_history = self.price_history[-self.max_history_size:]
+        if len(self.price_history) >= 2 * self.max_history_size:
+            del self.price_history[:-self.max_history_size]
+
+    @property
+    def history(self) -> List[PriceData]:
+        """Get the last max_history_size price data points, oldest first."""
+        return self.price_history[-self.max_history_size:]
+
+    @property
+    def history_size(self) -> int:
+        """Get the number of price data points in the history window."""
+        return min(len(self.price_history), self.max_history_size)
 
     def get_price_at_time(self, target_time: datetime) -> Optional[PriceData]:
         """Get the closest price data to a specific time."""
@@ -81,21 +124,25 @@ class PriceFeed:
             return None
 
         closest = min(
-            self.price_history,
+            self.history,
             key=lambda p: abs((p.timestamp - target_time).total_seconds())
         )
         return closest
 
     def get_recent_prices(self, count: int = 10) -> List[PriceData]:
         """Get the most recent price data points."""
-        return self.price_history[-count:] if self.price_history else []
+        if not self.price_history:
+            return []
+        if 0 < count <= self.max_history_size:
+            return self.price_history[-count:]
+        return self.history
 
     def get_price_change(self, seconds_ago: float = 60.0) -> Optional[float]:
         """Calculate price change over a time period."""
-        if not self.current_price or len(self.price_history) < 2:
+        if not self.current_price or self.history_size < 2:
             return None
 
-        target_time = datetime.utcnow()
+        target_time = utcnow()
         from datetime import timedelta
         past_time = target_time - timedelta(seconds=seconds_ago)
 
@@ -4,11 +4,15 @@ Price Manager - Central hub for managing all price feeds.
 
 import asyncio
 from datetime import datetime
-from typing import Dict, Optional, List, Callable
+from typing import Dict, Optional, List, Callable, Tuple, Union, Iterable
 from loguru import logger
 
 from .models import PriceData, PriceFeed, PriceLag, PriceSource
-from .chainlink_scraper import ChainlinkPriceScraper, ChainlinkOnChainReader
+from .chainlink_scraper import ChainlinkPriceScraper, ChainlinkOnChainReader, ChainlinkHTTPPoller
+
+
+# Symbols tracked by the price manager
+_SYMBOLS: Tuple[str, ...] = ("BTC", "ETH", "SOL", "XRP")
 
 
 class PriceManager:
@@ -16,26 +20,39 @@ class PriceManager:
     Central manager for all price feeds.
 
     Aggregates data from:
-    - Chainlink web scraper (primary, low latency)
+    - Chainlink HTTP poller (primary, batched JSON-RPC)
+    - Chainlink web scraper (optional fallback)
     - Chainlink on-chain reader (backup)
     - Polymarket implied prices
 
     Detects lag between oracle and market prices.
     """
 
-    def __init__(self, use_scraper: bool = True, use_onchain: bool = True):
+    def __init__(
+        self,
+        use_scraper: bool = True,
+        use_onchain: bool = True,
+        use_browser_fallback: bool = False,
+        reemit_unchanged_lag: bool = False
+    ):
         """
         Initialize the price manager.
 
         Args:
-            use_scraper: Use web scraper for Chainlink prices
+            use_scraper: Poll live Chainlink prices
             use_onchain: Use on-chain reader as backup
+            use_browser_fallback: Fall back to the Selenium web scraper if
+                the HTTP poller cannot be initialized
+            reemit_unchanged_lag: Re-notify lag callbacks for a profitable lag
+                even when neither feed has changed since the last check
         """
         self.use_scraper = use_scraper
         self.use_onchain = use_onchain
+        self.use_browser_fallback = use_browser_fallback
+        self.reemit_unchanged_lag = reemit_unchanged_lag
 
         # Price sources
-        self.scraper: Optional[ChainlinkPriceScraper] = None
+        self.scraper: Optional[Union[ChainlinkHTTPPoller, ChainlinkPriceScraper]] = None
         self.onchain_reader: Optional[ChainlinkOnChainReader] = None
 
         # Price feeds by symbol
@@ -46,6 +63,23 @@ class PriceManager:
         self._price_callbacks: List[Callable] = []
         self._lag_callbacks: List[Callable] = []
 
+        # Bounds concurrent per-symbol processing of a price batch
+        self._symbol_semaphore = asyncio.Semaphore(len(_SYMBOLS))
+
+        # Last lag computed per symbol, keyed by the inputs it was computed from
+        self._lag_memo: Dict[str, Tuple[Tuple, PriceLag, bool]] = {}
+
+        # Feed status snapshot, patched in place as prices arrive
+        self._status_cache: Dict = {
+            "oracle_feeds": {symbol: self._empty_feed_status() for symbol in _SYMBOLS},
+            "polymarket_feeds": {symbol: self._empty_feed_status() for symbol in _SYMBOLS},
+            "scraper_active": False,
+            "onchain_active": False
+        }
+
+        # Bumped on every price update so views can detect stale renders
+        self._rev = 0
+
         # Running state
         self._running = False
 
@@ -54,12 +88,25 @@ class PriceManager:
         logger.info("Initializing Price Manager...")
 
         # Initialize feeds
-        for symbol in ["BTC", "ETH", "SOL", "XRP"]:
+        for symbol in _SYMBOLS:
             self.oracle_feeds[symbol] = PriceFeed(symbol=symbol)
             self.polymarket_feeds[symbol] = PriceFeed(symbol=symbol)
 
-        # Initialize scraper
+        # Initialize live price source
         if self.use_scraper:
+            try:
+                self.scraper = ChainlinkHTTPPoller()
+                await self.scraper.initialize()
+                self.scraper.add_callback(self._on_scraped_prices)
+                logger.info("Chainlink HTTP poller initialized")
+            except Exception as e:
+                logger.error(f"Failed to initialize HTTP poller: {e}")
+                if self.scraper:
+                    await self.scraper.close()
+                self.scraper = None
+
+        # Fall back to the browser scraper if requested
+        if self.use_scraper and not self.scraper and self.use_browser_fallback:
             try:
                 self.scraper = ChainlinkPriceScraper(headless=True)
                 await self.scraper.initialize()
@@ -99,9 +146,21 @@ class PriceManager:
         self._lag_callbacks.append(callback)
 
     async def _on_scraped_prices(self, prices: Dict[str, PriceData]) -> None:
-        """Handle new scraped prices."""
-        for symbol, price_data in prices.items():
+        """Handle new scraped prices, processing symbols concurrently."""
+        results = await asyncio.gather(
+            *(self._process_symbol(symbol, price_data) for symbol, price_data in prices.items()),
+            return_exceptions=True
+        )
+
+        for symbol, result in zip(prices.keys(), results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing price for {symbol}: {result}")
+
+    async def _process_symbol(self, symbol: str, price_data: PriceData) -> None:
+        """Ingest a price for one symbol and run its callbacks and lag check."""
+        async with self._symbol_semaphore:
             self.oracle_feeds[symbol].update(price_data)
+            self._patch_feed_status("oracle_feeds", self.oracle_feeds[symbol])
 
             # Notify price callbacks
             for callback in self._price_callbacks:
@@ -129,32 +188,44 @@ class PriceManager:
         oracle_price = oracle_feed.current_price
         pm_price = polymarket_feed.current_price
 
-        # Calculate lag
-        lag_seconds = (oracle_price.timestamp - pm_price.timestamp).total_seconds()
-        price_diff_pct = ((oracle_price.price - pm_price.price) / pm_price.price) * 100
+        # Skip recomputation if neither feed changed since the last check
+        memo_key = (oracle_price.timestamp, pm_price.timestamp, oracle_price.price, pm_price.price)
+        memo = self._lag_memo.get(symbol)
+        if memo is not None and memo[0] == memo_key:
+            _, lag, is_profitable = memo
+            if not (is_profitable and self.reemit_unchanged_lag):
+                return
+        else:
+            # Calculate lag
+            lag_seconds = oracle_price.timestamp_ts - pm_price.timestamp_ts
+            price_diff_pct = ((oracle_price.price - pm_price.price) / pm_price.price) * 100
+
+            lag = PriceLag(
+                symbol=symbol,
+                oracle_price=oracle_price.price,
+                polymarket_price=pm_price.price,
+                oracle_timestamp=oracle_price.timestamp,
+                polymarket_timestamp=pm_price.timestamp,
+                lag_seconds=abs(lag_seconds),
+                price_difference_pct=price_diff_pct
+            )
+            is_profitable = lag.is_profitable
+            self._lag_memo[symbol] = (memo_key, lag, is_profitable)
 
-        lag = PriceLag(
-            symbol=symbol,
-            oracle_price=oracle_price.price,
-            polymarket_price=pm_price.price,
-            oracle_timestamp=oracle_price.timestamp,
-            polymarket_timestamp=pm_price.timestamp,
-            lag_seconds=abs(lag_seconds),
-            price_difference_pct=price_diff_pct
-        )
+            if not is_profitable:
+                return
 
-        # Notify lag callbacks if opportunity detected
-        if lag.is_profitable:
             logger.info(f"Profitable lag detected for {symbol}: {lag.price_difference_pct:.2f}% diff, {lag.lag_seconds:.1f}s lag")
 
-            for callback in self._lag_callbacks:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(lag)
-                    else:
-                        callback(lag)
-                except Exception as e:
-                    logger.error(f"Lag callback error: {e}")
+        # Notify lag callbacks
+        for callback in self._lag_callbacks:
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(lag)
+                else:
+                    callback(lag)
+            except Exception as e:
+                logger.error(f"Lag callback error: {e}")
 
     def update_polymarket_price(self, symbol: str, price: float, timestamp: datetime) -> None:
         """
@@ -176,6 +247,7 @@ class PriceManager:
             confidence=0.9
         )
         self.polymarket_feeds[symbol].update(price_data)
+        self._patch_feed_status("polymarket_feeds", self.polymarket_feeds[symbol])
 
     def get_oracle_price(self, symbol: str) -> Optional[PriceData]:
         """Get the current oracle price for a symbol."""
@@ -202,13 +274,47 @@ class PriceManager:
         Returns:
             PriceLag object or None
         """
-        oracle = self.get_oracle_price(symbol)
-        polymarket = self.get_polymarket_price(symbol)
+        return self._lag_between(symbol, self.get_oracle_price(symbol), self.get_polymarket_price(symbol))
 
+    def get_snapshot(
+        self,
+        symbols: Iterable[str] = _SYMBOLS
+    ) -> Dict[str, Tuple[Optional[PriceData], Optional[PriceData], Optional[PriceLag]]]:
+        """
+        Get the current oracle price, Polymarket price and lag for several symbols.
+
+        Args:
+            symbols: Symbols to include
+
+        Returns:
+            Dict of symbol to (oracle price, Polymarket price, lag)
+        """
+        oracle_feeds = self.oracle_feeds
+        polymarket_feeds = self.polymarket_feeds
+        snapshot = {}
+        for symbol in symbols:
+            oracle_feed = oracle_feeds.get(symbol)
+            polymarket_feed = polymarket_feeds.get(symbol)
+            oracle = oracle_feed.current_price if oracle_feed else None
+            polymarket = polymarket_feed.current_price if polymarket_feed else None
+            snapshot[symbol] = (oracle, polymarket, self._lag_between(symbol, oracle, polymarket))
+        return snapshot
+
+    def _lag_between(
+        self,
+        symbol: str,
+        oracle: Optional[PriceData],
+        polymarket: Optional[PriceData]
+    ) -> Optional[PriceLag]:
+        """Get the lag between two prices, reusing the last lag check if inputs match."""
         if not oracle or not polymarket:
             return None
 
-        lag_seconds = (oracle.timestamp - polymarket.timestamp).total_seconds()
+        memo = self._lag_memo.get(symbol)
+        if memo is not None and memo[0] == (oracle.timestamp, polymarket.timestamp, oracle.price, polymarket.price):
+            return memo[1]
+
+        lag_seconds = oracle.timestamp_ts - polymarket.timestamp_ts
         price_diff_pct = ((oracle.price - polymarket.price) / polymarket.price) * 100
 
         return PriceLag(
@@ -253,31 +359,42 @@ class PriceManager:
 
         return await self.onchain_reader.get_all_prices()
 
-    def get_feed_status(self) -> Dict:
-        """Get status of all price feeds."""
-        status = {
-            "oracle_feeds": {},
-            "polymarket_feeds": {},
-            "scraper_active": self.scraper is not None and self.scraper._running if self.scraper else False,
-            "onchain_active": self.onchain_reader is not None
+    @staticmethod
+    def _empty_feed_status() -> Dict:
+        """Get the status entry for a feed without price data."""
+        return {
+            "has_price": False,
+            "price": None,
+            "age_seconds": None,
+            "history_count": 0
         }
 
-        for symbol in ["BTC", "ETH", "SOL", "XRP"]:
-            oracle_feed = self.oracle_feeds.get(symbol)
-            pm_feed = self.polymarket_feeds.get(symbol)
-
-            status["oracle_feeds"][symbol] = {
-                "has_price": oracle_feed.current_price is not None if oracle_feed else False,
-                "price": oracle_feed.current_price.price if oracle_feed and oracle_feed.current_price else None,
-                "age_seconds": oracle_feed.current_price.age_seconds if oracle_feed and oracle_feed.current_price else None,
-                "history_count": len(oracle_feed.price_history) if oracle_feed else 0
-            }
-
-            status["polymarket_feeds"][symbol] = {
-                "has_price": pm_feed.current_price is not None if pm_feed else False,
-                "price": pm_feed.current_price.price if pm_feed and pm_feed.current_price else None,
-                "age_seconds": pm_feed.current_price.age_seconds if pm_feed and pm_feed.current_price else None,
-                "history_count": len(pm_feed.price_history) if pm_feed else 0
-            }
+    def _patch_feed_status(self, section: str, feed: PriceFeed) -> None:
+        """Update the cached status entry for a feed after a price update."""
+        self._rev += 1
+        entry = self._status_cache[section].get(feed.symbol)
+        if entry is None:
+            return
+
+        entry["has_price"] = feed.current_price is not None
+        entry["price"] = feed.current_price.price if feed.current_price else None
+        entry["history_count"] = feed.history_size
+
+    def get_feed_status(self) -> Dict:
+        """
+        Get status of all price feeds.
+
+        The returned dict is a shared snapshot updated in place; callers
+        should treat it as read-only.
+        """
+        status = self._status_cache
+        status["scraper_active"] = self.scraper._running if self.scraper else False
+        status["onchain_active"] = self.onchain_reader is not None
+
+        # Only the price ages change between updates
+        for section, feeds in (("oracle_feeds", self.oracle_feeds), ("polymarket_feeds", self.polymarket_feeds)):
+            for symbol, entry in status[section].items():
+                feed = feeds.get(symbol)
+                entry["age_seconds"] = feed.current_price.age_seconds if feed and feed.current_price else None
 
         return status
@@ -9,10 +9,12 @@ The strategy works as follows:
 5. Exit when market catches up to oracle price
 """
 
-import uuid
 import asyncio
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
-from typing import Optional, List, Dict, Callable
+from itertools import islice
+from typing import Optional, List, Dict, Callable, Deque, Set, Awaitable
 from loguru import logger
 
 from .models import (
@@ -20,6 +22,45 @@ from .models import (
 )
 from ..price_feeds.models import PriceData, PriceLag
 from ..polymarket.models import Market, OrderSide, OrderType
+from ..utils.clock import now_ns
+from ..utils.ids import gen_id
+
+
+# Reciprocals of the confidence normalization caps
+_INV_LAG = 1 / 30.0
+_INV_PROB_DIFF = 1 / 0.2
+_INV_LIQUIDITY = 1 / 10000
+
+
+def _confidence_score(
+    lag_seconds: float,
+    prob_diff: float,
+    oracle_confidence: float,
+    market_liquidity: float
+) -> float:
+    """
+    Calculate signal confidence score (0-1).
+
+    Weighted average of lag (max at 30s), probability difference (max at
+    20%), oracle confidence and liquidity (max at $10k). Not rounded;
+    format for display only.
+    """
+    return (
+        min(1.0, lag_seconds * _INV_LAG) * 0.3 +
+        min(1.0, prob_diff * _INV_PROB_DIFF) * 0.35 +
+        oracle_confidence * 0.2 +
+        min(1.0, market_liquidity * _INV_LIQUIDITY) * 0.15
+    )
+
+
+def _position_size(
+    confidence: float,
+    size_multiplier: float,
+    market_liquidity: float,
+    max_position_size: float
+) -> float:
+    """Scale max size by confidence and strength, capped at 10% of liquidity."""
+    return round(min(max_position_size * confidence * size_multiplier, market_liquidity * 0.1), 2)
 
 
 class LagTradingStrategy:
@@ -34,13 +75,28 @@ class LagTradingStrategy:
     - confidence_threshold: Minimum confidence to execute (default: 0.6)
     """
 
+    # Signal strength buckets by absolute probability difference
+    _STRENGTH_BINS = (0.05, 0.10, 0.15)
+    _STRENGTH_BY_BIN = (
+        SignalStrength.WEAK,
+        SignalStrength.MODERATE,
+        SignalStrength.STRONG,
+        SignalStrength.VERY_STRONG
+    )
+    _SIZE_MULT_BY_BIN = (0.25, 0.5, 0.75, 1.0)
+
+    # Extra entries a list buffer may hold before being trimmed back
+    _TRIM_SLACK = 64
+
     def __init__(
         self,
         lag_threshold: float = 10.0,
         price_diff_threshold: float = 0.3,
         max_position_size: float = 100.0,
         confidence_threshold: float = 0.6,
-        max_concurrent_positions: int = 3
+        max_concurrent_positions: int = 3,
+        background_signal_notify: bool = False,
+        oracle_heartbeat_s: float = 60.0
     ):
         """
         Initialize the strategy.
@@ -51,55 +107,138 @@ class LagTradingStrategy:
             max_position_size: Maximum position size in USD
             confidence_threshold: Minimum signal confidence
             max_concurrent_positions: Maximum concurrent open positions
+            background_signal_notify: Dispatch signal callbacks in a background
+                task instead of awaiting them on the tick
+            oracle_heartbeat_s: Maximum time in seconds since the oracle price
+                was last confirmed by its feed before ticks are ignored as stale
         """
         self.lag_threshold = lag_threshold
         self.price_diff_threshold = price_diff_threshold
         self.max_position_size = max_position_size
         self.confidence_threshold = confidence_threshold
         self.max_concurrent_positions = max_concurrent_positions
+        self.background_signal_notify = background_signal_notify
+        self.oracle_heartbeat_s = oracle_heartbeat_s
+
+        # Newest oracle timestamp analyzed per symbol, to drop out-of-order ticks
+        self._last_analyzed_ts: Dict[str, float] = {}
 
         # State
         self.state = StrategyState()
         self.active_opportunities: Dict[str, LagOpportunity] = {}
         self.pending_actions: List[TradeAction] = []
+        self.max_pending_actions = 100
 
         # Signal history
-        self.signal_history: List[Signal] = []
         self.max_signal_history = 1000
+        self.signal_history: Deque[Signal] = deque(maxlen=self.max_signal_history)
+
+        # Callbacks, split by kind at registration
+        self._signal_sync_callbacks: List[Callable] = []
+        self._signal_async_callbacks: List[Callable] = []
+        self._action_sync_callbacks: List[Callable] = []
+        self._action_async_callbacks: List[Callable] = []
+
+        # Background notification tasks (strong refs so they aren't GC'd)
+        self.max_inflight_tasks = 256
+        self._inflight_tasks: Set[asyncio.Task] = set()
 
-        # Callbacks
-        self._signal_callbacks: List[Callable] = []
-        self._action_callbacks: List[Callable] = []
+        # Trade actions are handled one at a time, in order, so each one's
+        # risk check sees the positions opened by the ones before it
+        self._action_lock = asyncio.Lock()
 
     def add_signal_callback(self, callback: Callable) -> None:
         """Add callback for new signals."""
-        self._signal_callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._signal_async_callbacks.append(callback)
+        else:
+            self._signal_sync_callbacks.append(callback)
 
     def add_action_callback(self, callback: Callable) -> None:
         """Add callback for trade actions."""
-        self._action_callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._action_async_callbacks.append(callback)
+        else:
+            self._action_sync_callbacks.append(callback)
+
+    async def _dispatch(self, notification: Awaitable[None]) -> None:
+        """
+        Run a notification in the background so the tick can return.
+
+        Falls back to awaiting inline once max_inflight_tasks are pending,
+        which applies backpressure instead of growing without bound.
+        """
+        if len(self._inflight_tasks) >= self.max_inflight_tasks:
+            await notification
+            return
+
+        task = asyncio.create_task(notification)
+        self._inflight_tasks.add(task)
+        task.add_done_callback(self._inflight_tasks.discard)
 
     async def _notify_signal(self, signal: Signal) -> None:
         """Notify callbacks of new signal."""
-        for callback in self._signal_callbacks:
+        for callback in self._signal_sync_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(signal)
-                else:
-                    callback(signal)
+                callback(signal)
             except Exception as e:
-                logger.error(f"Signal callback error: {e}")
+                logger.error("Signal callback error: {}", e)
+
+        if self._signal_async_callbacks:
+            results = await asyncio.gather(
+                *(callback(signal) for callback in self._signal_async_callbacks),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Signal callback error: {}", result)
 
     async def _notify_action(self, action: TradeAction) -> None:
-        """Notify callbacks of trade action."""
-        for callback in self._action_callbacks:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(action)
-                else:
+        """Notify callbacks of trade action, after earlier actions are handled."""
+        async with self._action_lock:
+            for callback in self._action_sync_callbacks:
+                try:
                     callback(action)
-            except Exception as e:
-                logger.error(f"Action callback error: {e}")
+                except Exception as e:
+                    logger.error("Action callback error: {}", e)
+
+            if self._action_async_callbacks:
+                results = await asyncio.gather(
+                    *(callback(action) for callback in self._action_async_callbacks),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        logger.error("Action callback error: {}", result)
+
+    def _is_fresh_oracle(self, symbol: str, oracle_price: PriceData) -> bool:
+        """
+        Check an oracle tick is in order and within the heartbeat window.
+
+        Ticks older than the newest one already analyzed for the symbol, or
+        whose timestamp is more than oracle_heartbeat_s old, are dropped
+        before any signal math and counted in the strategy state.
+
+        The timestamp is the last time the source confirmed the price: the
+        price feeds re-stamp the current round on every successful poll.
+        A stale tick therefore means the feed itself has stopped updating,
+        not that the Chainlink round is old (rounds are published on
+        deviation and can legitimately last many minutes).
+        """
+        ts = oracle_price.timestamp_ts
+        if ts < self._last_analyzed_ts.get(symbol, 0.0):
+            self.state.out_of_order_ticks_dropped += 1
+            logger.debug("Dropped out-of-order {} oracle tick", symbol)
+            return False
+
+        age = now_ns() * 1e-9 - ts
+        if age > self.oracle_heartbeat_s:
+            self.state.stale_ticks_dropped += 1
+            logger.debug("Dropped stale {} oracle tick ({:.1f}s old)", symbol, age)
+            return False
+
+        self._last_analyzed_ts[symbol] = ts
+        return True
 
     def analyze_lag(
         self,
@@ -121,8 +260,11 @@ class LagTradingStrategy:
         if not oracle_price or not market:
             return None
 
+        if not self._is_fresh_oracle(symbol, oracle_price):
+            return None
+
         # Get market implied price
-        market_implied = market.get_implied_price()
+        market_implied = market.implied_price_cached
         if not market_implied:
             return None
 
@@ -135,14 +277,13 @@ class LagTradingStrategy:
         price_diff_pct = ((oracle_price.price - market_implied) / market_implied) * 100
 
         # Get Yes outcome for trading
-        yes_outcome = market.get_yes_outcome()
+        yes_outcome = market.yes_outcome_cached
         if not yes_outcome:
             return None
 
         # Calculate implied lag (time since market last updated)
         if yes_outcome.order_book:
-            market_time = yes_outcome.order_book.timestamp
-            lag_seconds = (oracle_price.timestamp - market_time).total_seconds()
+            lag_seconds = oracle_price.timestamp_ts - yes_outcome.order_book.timestamp_ts
         else:
             lag_seconds = 15.0  # Assume some lag if no order book
 
@@ -165,44 +306,33 @@ class LagTradingStrategy:
         # Calculate mispricing
         prob_diff = expected_prob - market_prob
 
-        # Generate signal
-        signal_type = SignalType.NO_ACTION
-        strength = SignalStrength.WEAK
-        reason = ""
-
-        # Check if lag and price difference meet thresholds
-        if abs(lag_seconds) >= self.lag_threshold:
-            if abs(prob_diff) >= 0.05:  # 5% probability difference
-                if prob_diff > 0:
-                    # Market underpriced Yes (oracle suggests higher)
-                    signal_type = SignalType.BUY_YES
-                    reason = f"Oracle ${oracle_price.price:.2f} above threshold ${threshold_price:.0f}, market lagging"
-                else:
-                    # Market overpriced Yes (oracle suggests lower)
-                    signal_type = SignalType.BUY_NO
-                    reason = f"Oracle ${oracle_price.price:.2f} suggests lower prob, market lagging"
-
-                # Determine strength
-                if abs(prob_diff) >= 0.15:
-                    strength = SignalStrength.VERY_STRONG
-                elif abs(prob_diff) >= 0.10:
-                    strength = SignalStrength.STRONG
-                elif abs(prob_diff) >= 0.05:
-                    strength = SignalStrength.MODERATE
+        # Non-actionable ticks only count towards the total; no Signal is built
+        if abs(lag_seconds) < self.lag_threshold or abs(prob_diff) < 0.05:
+            self.state.total_signals_generated += 1
+            return None
+
+        if prob_diff > 0:
+            # Market underpriced Yes (oracle suggests higher)
+            signal_type = SignalType.BUY_YES
+            reason = f"Oracle ${oracle_price.price:.2f} above threshold ${threshold_price:.0f}, market lagging"
+        else:
+            # Market overpriced Yes (oracle suggests lower)
+            signal_type = SignalType.BUY_NO
+            reason = f"Oracle ${oracle_price.price:.2f} suggests lower prob, market lagging"
+
+        # Determine strength bucket
+        strength_idx = bisect_right(self._STRENGTH_BINS, abs(prob_diff))
+        strength = self._STRENGTH_BY_BIN[strength_idx]
 
         # Calculate confidence based on multiple factors
-        confidence = self._calculate_confidence(
-            lag_seconds=abs(lag_seconds),
-            prob_diff=abs(prob_diff),
-            oracle_confidence=oracle_price.confidence,
-            market_liquidity=market.liquidity
+        liquidity = market.liquidity
+        confidence = _confidence_score(
+            abs(lag_seconds), abs(prob_diff), oracle_price.confidence, liquidity
         )
 
         # Calculate recommended size
-        recommended_size = self._calculate_position_size(
-            confidence=confidence,
-            strength=strength,
-            market_liquidity=market.liquidity
+        recommended_size = _position_size(
+            confidence, self._SIZE_MULT_BY_BIN[strength_idx], liquidity, self.max_position_size
         )
 
         # Calculate expected profit
@@ -231,77 +361,16 @@ class LagTradingStrategy:
 
         # Update state
         self.state.total_signals_generated += 1
-        self.state.last_signal_time = signal.timestamp
+        self.state.last_signal_ns = signal.timestamp_ns
 
         if signal.is_actionable:
             self.state.actionable_signals += 1
 
         # Store in history
         self.signal_history.append(signal)
-        if len(self.signal_history) > self.max_signal_history:
-            self.signal_history = self.signal_history[-self.max_signal_history:]
 
         return signal
 
-    def _calculate_confidence(
-        self,
-        lag_seconds: float,
-        prob_diff: float,
-        oracle_confidence: float,
-        market_liquidity: float
-    ) -> float:
-        """Calculate signal confidence score (0-1)."""
-        # Base confidence from lag
-        lag_factor = min(1.0, lag_seconds / 30.0)  # Max at 30s lag
-
-        # Confidence from probability difference
-        prob_factor = min(1.0, prob_diff / 0.2)  # Max at 20% diff
-
-        # Oracle confidence factor
-        oracle_factor = oracle_confidence
-
-        # Liquidity factor (higher liquidity = higher confidence)
-        liquidity_factor = min(1.0, market_liquidity / 10000)  # Max at $10k
-
-        # Weighted average
-        confidence = (
-            lag_factor * 0.3 +
-            prob_factor * 0.35 +
-            oracle_factor * 0.2 +
-            liquidity_factor * 0.15
-        )
-
-        return round(confidence, 3)
-
-    def _calculate_position_size(
-        self,
-        confidence: float,
-        strength: SignalStrength,
-        market_liquidity: float
-    ) -> float:
-        """Calculate recommended position size."""
-        # Base size
-        base_size = self.max_position_size
-
-        # Scale by confidence
-        size = base_size * confidence
-
-        # Scale by strength
-        strength_multipliers = {
-            SignalStrength.WEAK: 0.25,
-            SignalStrength.MODERATE: 0.5,
-            SignalStrength.STRONG: 0.75,
-            SignalStrength.VERY_STRONG: 1.0
-        }
-        size *= strength_multipliers.get(strength, 0.5)
-
-        # Don't exceed 10% of market liquidity
-        max_from_liquidity = market_liquidity * 0.1
-        size = min(size, max_from_liquidity)
-
-        # Round to 2 decimal places
-        return round(size, 2)
-
     def _calculate_expected_profit(
         self,
         prob_diff: float,
@@ -356,7 +425,7 @@ class LagTradingStrategy:
             return None
 
         action = TradeAction(
-            action_id=str(uuid.uuid4()),
+            action_id=gen_id("act"),
             signal=signal,
             token_id=token_id,
             side=side,
@@ -370,6 +439,10 @@ class LagTradingStrategy:
 
         self.pending_actions.append(action)
 
+        # Trim in place only once over by a batch, amortizing the memmove
+        if len(self.pending_actions) > self.max_pending_actions + self._TRIM_SLACK:
+            del self.pending_actions[:-self.max_pending_actions]
+
         return action
 
     def _calculate_stop_loss(self, signal: Signal) -> float:
@@ -410,18 +483,25 @@ class LagTradingStrategy:
         signal = self.analyze_lag(symbol, oracle_price, market)
 
         if signal:
-            await self._notify_signal(signal)
+            await self._handle_signal(signal)
 
-            if signal.is_actionable and self.state.is_trading_enabled:
-                action = self.generate_trade_action(
-                    signal,
-                    self.state.current_positions
-                )
+        return signal
 
-                if action:
-                    await self._notify_action(action)
+    async def _handle_signal(self, signal: Signal) -> None:
+        """Notify observers of a signal and generate a trade action if warranted."""
+        if self.background_signal_notify:
+            await self._dispatch(self._notify_signal(signal))
+        else:
+            await self._notify_signal(signal)
 
-        return signal
+        if signal.is_actionable and self.state.is_trading_enabled:
+            action = self.generate_trade_action(
+                signal,
+                self.state.current_positions
+            )
+
+            if action:
+                await self._dispatch(self._notify_action(action))
 
     def start(self, trading_enabled: bool = False) -> None:
         """Start the strategy."""
@@ -435,6 +515,20 @@ class LagTradingStrategy:
         self.state.is_active = False
         logger.info("Strategy stopped")
 
+    async def shutdown(self) -> None:
+        """
+        Stop the strategy and wait for in-flight notifications to finish.
+
+        Call before closing the clients and database that action callbacks
+        use, so no dispatched order or notification runs against a closed
+        resource. Callback errors are already logged by the notifiers.
+        """
+        self.stop()
+
+        if self._inflight_tasks:
+            logger.debug("Draining {} in-flight notification(s)", len(self._inflight_tasks))
+            await asyncio.gather(*self._inflight_tasks, return_exceptions=True)
+
     def enable_trading(self) -> None:
         """Enable live trading."""
         self.state.is_trading_enabled = True
@@ -451,7 +545,8 @@ class LagTradingStrategy:
 
     def get_recent_signals(self, count: int = 10) -> List[Dict]:
         """Get recent signals."""
-        return [s.to_dict() for s in self.signal_history[-count:]]
+        start = max(0, len(self.signal_history) - count)
+        return [s.to_dict() for s in islice(self.signal_history, start, None)]
 
     def get_pending_actions(self) -> List[Dict]:
         """Get pending trade actions."""
@@ -7,6 +7,8 @@ from datetime import datetime
 from typing import Optional, Dict, List
 from enum import Enum
 
+from ..utils.clock import now_ns, ns_to_datetime
+
 
 class SignalType(Enum):
     """Type of trading signal."""
@@ -24,7 +26,12 @@ class SignalStrength(Enum):
     VERY_STRONG = "very_strong"
 
 
-@dataclass
+_ACTIONABLE_STRENGTHS = frozenset((
+    SignalStrength.MODERATE, SignalStrength.STRONG, SignalStrength.VERY_STRONG
+))
+
+
+@dataclass(slots=True)
 class Signal:
     """
     Trading signal generated by the strategy.
@@ -38,22 +45,27 @@ class Signal:
     lag_seconds: float
     price_diff_pct: float
     confidence: float
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=now_ns)
     reason: str = ""
     market_id: Optional[str] = None
     token_id: Optional[str] = None
     recommended_size: float = 0.0
     expected_profit_pct: float = 0.0
+    is_actionable: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def is_actionable(self) -> bool:
-        """Check if signal should be acted upon."""
-        return (
-            self.signal_type != SignalType.NO_ACTION and
-            self.strength in [SignalStrength.MODERATE, SignalStrength.STRONG, SignalStrength.VERY_STRONG] and
+    def __post_init__(self) -> None:
+        # Whether the signal should be acted upon, computed once at creation
+        self.is_actionable = (
+            self.signal_type is not SignalType.NO_ACTION and
+            self.strength in _ACTIONABLE_STRENGTHS and
             self.confidence >= 0.6
         )
 
+    @property
+    def timestamp(self) -> datetime:
+        """Signal creation time as a naive UTC datetime."""
+        return ns_to_datetime(self.timestamp_ns)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
         return {
@@ -76,7 +88,7 @@ class Signal:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeAction:
     """
     Trade action to be executed.
@@ -131,10 +143,17 @@ class StrategyState:
     current_positions: int = 0
     daily_pnl: float = 0.0
     daily_trades: int = 0
-    last_signal_time: Optional[datetime] = None
+    stale_ticks_dropped: int = 0
+    out_of_order_ticks_dropped: int = 0
+    last_signal_ns: Optional[int] = None
     last_trade_time: Optional[datetime] = None
     started_at: Optional[datetime] = None
 
+    @property
+    def last_signal_time(self) -> Optional[datetime]:
+        """Time of the last signal as a naive UTC datetime."""
+        return ns_to_datetime(self.last_signal_ns) if self.last_signal_ns is not None else None
+
     @property
     def win_rate(self) -> float:
         """Calculate win rate."""
@@ -156,7 +175,9 @@ class StrategyState:
             "current_positions": self.current_positions,
             "daily_pnl": self.daily_pnl,
             "daily_trades": self.daily_trades,
-            "last_signal_time": self.last_signal_time.isoformat() if self.last_signal_time else None,
+            "stale_ticks_dropped": self.stale_ticks_dropped,
+            "out_of_order_ticks_dropped": self.out_of_order_ticks_dropped,
+            "last_signal_time": self.last_signal_time.isoformat() if self.last_signal_ns is not None else None,
             "last_trade_time": self.last_trade_time.isoformat() if self.last_trade_time else None,
             "started_at": self.started_at.isoformat() if self.started_at else None
         }
@@ -2,13 +2,15 @@
 Position Manager - Tracks and manages open positions.
 """
 
-import uuid
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, List, Optional, Deque, Set, Tuple
 from loguru import logger
 
 from ..polymarket.models import Position, PositionStatus, OrderSide
 from .models import TradeAction
+from ..utils.ids import gen_id
 
 
 class PositionManager:
@@ -23,8 +25,9 @@ class PositionManager:
     def __init__(self):
         """Initialize position manager."""
         self.open_positions: Dict[str, Position] = {}
-        self.closed_positions: List[Position] = []
+        self._positions_by_token: Dict[str, Set[str]] = {}
         self.max_closed_history = 500
+        self.closed_positions: Deque[Position] = deque(maxlen=self.max_closed_history)
 
         # Aggregate statistics
         self.total_realized_pnl: float = 0.0
@@ -32,6 +35,23 @@ class PositionManager:
         self.winning_trades: int = 0
         self.losing_trades: int = 0
 
+        # Running totals over open positions, kept in sync by _set_position_price
+        self._exposure_sum: float = 0.0
+        self._unrealized_pnl_sum: float = 0.0
+
+        # Bumped on every position mutation so views can detect stale renders
+        self._rev = 0
+
+    def _set_position_price(self, position: Position, current_price: float) -> None:
+        """Set an open position's price and update the running totals."""
+        # Both totals are linear in price, so apply the delta directly
+        delta = (current_price - position.current_price) * position.size
+        position.current_price = current_price
+        self._rev += 1
+
+        self._exposure_sum += delta
+        self._unrealized_pnl_sum += delta if position.side is OrderSide.BUY else -delta
+
     def open_position(
         self,
         action: TradeAction,
@@ -48,7 +68,7 @@ class PositionManager:
             New Position object
         """
         position = Position(
-            position_id=str(uuid.uuid4()),
+            position_id=gen_id("pos"),
             market_id=action.signal.market_id or "",
             token_id=action.token_id,
             outcome="Yes" if action.signal.signal_type.value == "buy_yes" else "No",
@@ -61,9 +81,13 @@ class PositionManager:
         )
 
         self.open_positions[position.position_id] = position
+        self._positions_by_token.setdefault(position.token_id, set()).add(position.position_id)
+        self._exposure_sum += position.market_value
+        self._unrealized_pnl_sum += position.unrealized_pnl
         self.total_trades += 1
+        self._rev += 1
 
-        logger.info(f"Opened position {position.position_id}: {position.outcome} @ {execution_price} x {action.size}")
+        logger.info("Opened position {}: {} @ {} x {}", position.position_id, position.outcome, execution_price, action.size)
 
         return position
 
@@ -82,7 +106,7 @@ class PositionManager:
         if not position:
             return None
 
-        position.current_price = current_price
+        self._set_position_price(position, current_price)
         return position
 
     def close_position(
@@ -108,62 +132,81 @@ class PositionManager:
             return None
 
         # Calculate PnL
-        position.current_price = exit_price
+        self._set_position_price(position, exit_price)
         pnl = position.unrealized_pnl
         position.realized_pnl = pnl
 
+        # Remove from running totals
+        if len(self.open_positions) == 1:
+            # Reset to avoid accumulating float drift
+            self._exposure_sum = 0.0
+            self._unrealized_pnl_sum = 0.0
+        else:
+            self._exposure_sum -= position.market_value
+            self._unrealized_pnl_sum -= pnl
+
         # Update status
         position.status = PositionStatus.CLOSED
         position.closed_at = datetime.utcnow()
 
         # Move to closed positions
         del self.open_positions[position_id]
+        token_positions = self._positions_by_token.get(position.token_id)
+        if token_positions is not None:
+            token_positions.discard(position_id)
+            if not token_positions:
+                del self._positions_by_token[position.token_id]
         self.closed_positions.append(position)
 
-        # Trim history
-        if len(self.closed_positions) > self.max_closed_history:
-            self.closed_positions = self.closed_positions[-self.max_closed_history:]
-
         # Update statistics
         self.total_realized_pnl += pnl
         if pnl > 0:
             self.winning_trades += 1
         else:
             self.losing_trades += 1
+        self._rev += 1
 
-        logger.info(f"Closed position {position_id}: PnL ${pnl:.2f} ({reason})")
+        logger.info("Closed position {}: PnL ${:.2f} ({})", position_id, pnl, reason)
 
         return position, pnl
 
-    def check_stop_losses(self, price_updates: Dict[str, float]) -> List[str]:
+    def check_exits(self, price_updates: Dict[str, float]) -> Tuple[List[str], List[str]]:
         """
-        Check if any positions hit stop loss.
+        Update prices and check stop loss / take profit in a single pass.
+
+        Only positions whose token appears in price_updates are visited.
 
         Args:
             price_updates: Dict mapping token_id to current price
 
         Returns:
-            List of position IDs that should be closed
+            Tuple of (stop loss position IDs, take profit position IDs)
         """
-        to_close = []
+        stop_losses = []
+        take_profits = []
 
-        for position_id, position in self.open_positions.items():
-            current_price = price_updates.get(position.token_id)
+        for token_id, current_price in price_updates.items():
             if not current_price:
                 continue
 
-            position.current_price = current_price
+            for position_id in self._positions_by_token.get(token_id, ()):
+                position = self.open_positions[position_id]
+                self._set_position_price(position, current_price)
+                pnl_pct = position.unrealized_pnl_pct
 
-            # Check if unrealized loss exceeds stop loss threshold (5%)
-            if position.unrealized_pnl_pct <= -5.0:
-                to_close.append(position_id)
-                logger.warning(f"Position {position_id} hit stop loss: {position.unrealized_pnl_pct:.2f}%")
+                # Stop loss at 5% unrealized loss, take profit at 10% gain
+                if pnl_pct <= -5.0:
+                    stop_losses.append(position_id)
+                    logger.warning("Position {} hit stop loss: {:.2f}%", position_id, pnl_pct)
+                elif pnl_pct >= 10.0:
+                    take_profits.append(position_id)
+                    logger.info("Position {} hit take profit: {:.2f}%", position_id, pnl_pct)
 
-        return to_close
+        return stop_losses, take_profits
 
-    def check_take_profits(self, price_updates: Dict[str, float]) -> List[str]:
+    def check_stop_losses(self, price_updates: Dict[str, float]) -> List[str]:
         """
-        Check if any positions hit take profit.
+        Check if any positions hit stop loss.
 
         Args:
             price_updates: Dict mapping token_id to current price
@@ -171,21 +214,19 @@ class PositionManager:
         Returns:
             List of position IDs that should be closed
         """
-        to_close = []
+        return self.check_exits(price_updates)[0]
 
-        for position_id, position in self.open_positions.items():
-            current_price = price_updates.get(position.token_id)
-            if not current_price:
-                continue
-
-            position.current_price = current_price
+    def check_take_profits(self, price_updates: Dict[str, float]) -> List[str]:
+        """
+        Check if any positions hit take profit.
 
-            # Check if unrealized profit exceeds take profit threshold (10%)
-            if position.unrealized_pnl_pct >= 10.0:
-                to_close.append(position_id)
-                logger.info(f"Position {position_id} hit take profit: {position.unrealized_pnl_pct:.2f}%")
+        Args:
+            price_updates: Dict mapping token_id to current price
 
-        return to_close
+        Returns:
+            List of position IDs that should be closed
+        """
+        return self.check_exits(price_updates)[1]
 
     def get_position(self, position_id: str) -> Optional[Position]:
         """Get a position by ID."""
@@ -202,11 +243,11 @@ class PositionManager:
 
     def get_total_exposure(self) -> float:
         """Get total USD value of open positions."""
-        return sum(p.market_value for p in self.open_positions.values())
+        return self._exposure_sum
 
     def get_total_unrealized_pnl(self) -> float:
         """Get total unrealized PnL."""
-        return sum(p.unrealized_pnl for p in self.open_positions.values())
+        return self._unrealized_pnl_sum
 
     def get_statistics(self) -> Dict:
         """Get position statistics."""
@@ -227,4 +268,5 @@ class PositionManager:
 
     def get_closed_positions(self, limit: int = 20) -> List[Dict]:
         """Get recent closed positions."""
-        return [p.to_dict() for p in self.closed_positions[-limit:]]
+        start = max(0, len(self.closed_positions) - limit)
+        return [p.to_dict() for p in islice(self.closed_positions, start, None)]
@@ -2,17 +2,32 @@
 Risk Manager - Controls trading risk and position limits.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import time
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, List, Optional, Deque, NamedTuple
 from dataclasses import dataclass, field
 from loguru import logger
 
 from .models import TradeAction, Signal
+from ..utils.clock import now_ns, ns_to_datetime
 
 
-@dataclass
+# Shared success result for can_trade/validate_trade; failure reasons are
+# only formatted on the rejecting branch
+_ALLOWED: tuple[bool, str] = (True, "OK")
+
+
+@dataclass(frozen=True)
 class RiskLimits:
-    """Risk limit configuration."""
+    """
+    Risk limit configuration.
+
+    Immutable so derived thresholds can be computed once; use
+    dataclasses.replace() to change a limit.
+    """
     max_position_size_usd: float = 100.0
     max_daily_loss_usd: float = 50.0
     max_concurrent_positions: int = 3
@@ -21,6 +36,34 @@ class RiskLimits:
     min_liquidity_usd: float = 500.0
     max_exposure_pct: float = 50.0  # Max % of balance in positions
     cooldown_after_loss_seconds: float = 60.0
+    max_trade_history: int = 1024
+
+    # Derived thresholds
+    _max_slippage_frac: float = field(init=False, repr=False, compare=False)
+    _max_position_cents: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_max_slippage_frac", self.max_slippage_pct / 100.0)
+        object.__setattr__(self, "_max_position_cents", round(self.max_position_size_usd * 100))
+
+
+class TradeRecord(NamedTuple):
+    """Closed trade entry in the risk manager's history."""
+    pnl: float
+    position_size: float
+    timestamp_ns: int
+    daily_pnl: float
+    daily_trades: int
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "pnl": self.pnl,
+            "position_size": self.position_size,
+            "timestamp": ns_to_datetime(self.timestamp_ns).isoformat(),
+            "daily_pnl": self.daily_pnl,
+            "daily_trades": self.daily_trades
+        }
 
 
 @dataclass
@@ -30,17 +73,23 @@ class RiskState:
     daily_trades: int = 0
     daily_losses: int = 0
     current_exposure_usd: float = 0.0
-    last_loss_time: Optional[datetime] = None
+    last_loss_monotonic: float = 0.0  # time.monotonic() of the last loss
+    cooldown_until_monotonic: float = 0.0
     in_cooldown: bool = False
     positions_count: int = 0
     day_start: datetime = field(default_factory=lambda: datetime.utcnow().replace(hour=0, minute=0, second=0))
+    day_ordinal: int = field(init=False)  # day_start.toordinal(), for cheap rollover checks
+
+    def __post_init__(self) -> None:
+        self.day_ordinal = self.day_start.toordinal()
 
-    def reset_daily(self) -> None:
+    def reset_daily(self, now: Optional[datetime] = None) -> None:
         """Reset daily statistics."""
         self.daily_pnl = 0.0
         self.daily_trades = 0
         self.daily_losses = 0
-        self.day_start = datetime.utcnow().replace(hour=0, minute=0, second=0)
+        self.day_start = (now or datetime.utcnow()).replace(hour=0, minute=0, second=0)
+        self.day_ordinal = self.day_start.toordinal()
 
 
 class RiskManager:
@@ -64,23 +113,63 @@ class RiskManager:
         """
         self.limits = limits or RiskLimits()
         self.state = RiskState()
-        self._trade_history: List[Dict] = []
+        self._trade_history: Deque[TradeRecord] = deque(maxlen=self.limits.max_trade_history)
 
-    def check_daily_reset(self) -> None:
-        """Check if daily stats should be reset."""
-        now = datetime.utcnow()
-        if now.date() > self.state.day_start.date():
+        # Last can_trade result and the monotonic time it was computed
+        self.can_trade_ttl_seconds = 1.0
+        self._can_trade_cache: tuple[float, tuple[bool, str]] = (float("-inf"), _ALLOWED)
+
+        # Bumped on every state change so views can detect stale renders
+        self._rev = 0
+
+        # Limits are frozen, so the status view is built once and shared
+        self._limits_view = MappingProxyType({
+            "max_position_size": self.limits.max_position_size_usd,
+            "max_daily_loss": self.limits.max_daily_loss_usd,
+            "max_positions": self.limits.max_concurrent_positions
+        })
+
+    def check_daily_reset(self, now: Optional[datetime] = None) -> None:
+        """
+        Check if daily stats should be reset.
+
+        Args:
+            now: Current UTC time, if the caller already has it
+        """
+        now = now or datetime.utcnow()
+        if now.toordinal() > self.state.day_ordinal:
             logger.info("Resetting daily risk statistics")
-            self.state.reset_daily()
+            self.state.reset_daily(now)
+            self._rev += 1
 
     def can_trade(self) -> tuple[bool, str]:
         """
         Check if trading is currently allowed.
 
+        The result is reused for can_trade_ttl_seconds; opening or closing
+        a trade invalidates it immediately. Only for status reads:
+        validate_trade always evaluates the limits afresh.
+
         Returns:
             Tuple of (can_trade, reason)
         """
-        self.check_daily_reset()
+        mono = time.monotonic()
+        cached_at, result = self._can_trade_cache
+        if mono - cached_at < self.can_trade_ttl_seconds:
+            return result
+
+        result = self._evaluate_can_trade(mono)
+        self._can_trade_cache = (mono, result)
+        return result
+
+    def _invalidate_can_trade(self) -> None:
+        """Force the next can_trade call to re-evaluate the limits."""
+        self._can_trade_cache = (float("-inf"), _ALLOWED)
+
+    def _evaluate_can_trade(self, mono: float) -> tuple[bool, str]:
+        """Evaluate trading limits at monotonic time mono."""
+        now = datetime.utcnow()
+        self.check_daily_reset(now)
 
         # Check daily loss limit
         if abs(self.state.daily_pnl) >= self.limits.max_daily_loss_usd and self.state.daily_pnl < 0:
@@ -92,15 +181,12 @@ class RiskManager:
 
         # Check cooldown
         if self.state.in_cooldown:
-            if self.state.last_loss_time:
-                cooldown_end = self.state.last_loss_time + timedelta(seconds=self.limits.cooldown_after_loss_seconds)
-                if datetime.utcnow() < cooldown_end:
-                    remaining = (cooldown_end - datetime.utcnow()).seconds
-                    return False, f"In cooldown after loss ({remaining}s remaining)"
-                else:
-                    self.state.in_cooldown = False
+            remaining = self.state.cooldown_until_monotonic - mono
+            if remaining > 0:
+                return False, f"In cooldown after loss ({remaining:.0f}s remaining)"
+            self.state.in_cooldown = False
 
-        return True, "OK"
+        return _ALLOWED
 
     def validate_trade(self, action: TradeAction) -> tuple[bool, str]:
         """
@@ -112,24 +198,27 @@ class RiskManager:
         Returns:
             Tuple of (is_valid, reason)
         """
-        # Check if trading allowed
-        can_trade, reason = self.can_trade()
+        # Check if trading allowed, never from the status cache
+        can_trade, reason = self._evaluate_can_trade(time.monotonic())
         if not can_trade:
             return False, reason
 
+        limits = self.limits
+        max_size = limits.max_position_size_usd
+
         # Check position size
-        if action.size > self.limits.max_position_size_usd:
-            return False, f"Position size ${action.size:.2f} exceeds limit ${self.limits.max_position_size_usd:.2f}"
+        if action.size > max_size:
+            return False, f"Position size ${action.size:.2f} exceeds limit ${max_size:.2f}"
 
         # Check slippage
-        if action.max_slippage > self.limits.max_slippage_pct / 100:
-            return False, f"Slippage {action.max_slippage*100:.1f}% exceeds limit {self.limits.max_slippage_pct:.1f}%"
+        if action.max_slippage > limits._max_slippage_frac:
+            return False, f"Slippage {action.max_slippage*100:.1f}% exceeds limit {limits.max_slippage_pct:.1f}%"
 
         # Check signal confidence
         if action.signal.confidence < 0.5:
             return False, f"Signal confidence {action.signal.confidence:.2f} too low"
 
-        return True, "OK"
+        return _ALLOWED
 
     def adjust_position_size(
         self,
@@ -148,35 +237,37 @@ class RiskManager:
         Returns:
             Adjusted position size
         """
-        size = requested_size
+        # Work in integer cents (and confidence in basis points) so scaling
+        # floors deterministically instead of accumulating float drift
+        size_cents = round(requested_size * 100)
 
         # Scale by confidence
-        size *= confidence
+        size_cents = size_cents * round(confidence * 10000) // 10000
 
         # Don't exceed max position size
-        size = min(size, self.limits.max_position_size_usd)
+        size_cents = min(size_cents, self.limits._max_position_cents)
 
         # Don't exceed 10% of market liquidity
-        max_from_liquidity = market_liquidity * 0.10
-        size = min(size, max_from_liquidity)
+        size_cents = min(size_cents, int(market_liquidity * 10))
 
-        # Reduce size if we have losses today
+        # Reduce size if we have losses today (10% per loss, down to half)
         if self.state.daily_losses > 0:
-            reduction_factor = max(0.5, 1.0 - (self.state.daily_losses * 0.1))
-            size *= reduction_factor
+            reduction_pct = max(50, 100 - self.state.daily_losses * 10)
+            size_cents = size_cents * reduction_pct // 100
 
-        # Minimum size threshold
-        min_size = 5.0
-        if size < min_size:
+        # Minimum size threshold ($5)
+        if size_cents < 500:
             return 0.0  # Don't trade if size too small
 
-        return round(size, 2)
+        return size_cents / 100
 
     def on_trade_opened(self, position_size: float) -> None:
         """Record a new position opened."""
         self.state.positions_count += 1
         self.state.current_exposure_usd += position_size
         self.state.daily_trades += 1
+        self._rev += 1
+        self._invalidate_can_trade()
 
     def on_trade_closed(self, pnl: float, position_size: float) -> None:
         """
@@ -189,20 +280,20 @@ class RiskManager:
         self.state.positions_count = max(0, self.state.positions_count - 1)
         self.state.current_exposure_usd = max(0, self.state.current_exposure_usd - position_size)
         self.state.daily_pnl += pnl
+        self._rev += 1
+        self._invalidate_can_trade()
 
         if pnl < 0:
             self.state.daily_losses += 1
-            self.state.last_loss_time = datetime.utcnow()
+            loss_time = time.monotonic()
+            self.state.last_loss_monotonic = loss_time
+            self.state.cooldown_until_monotonic = loss_time + self.limits.cooldown_after_loss_seconds
             self.state.in_cooldown = True
-            logger.warning(f"Loss recorded: ${pnl:.2f}, entering cooldown")
+            logger.warning("Loss recorded: ${:.2f}, entering cooldown", pnl)
 
-        self._trade_history.append({
-            "pnl": pnl,
-            "position_size": position_size,
-            "timestamp": datetime.utcnow().isoformat(),
-            "daily_pnl": self.state.daily_pnl,
-            "daily_trades": self.state.daily_trades
-        })
+        self._trade_history.append(TradeRecord(
+            pnl, position_size, now_ns(), self.state.daily_pnl, self.state.daily_trades
+        ))
 
     def get_status(self) -> Dict:
         """Get current risk status."""
@@ -217,13 +308,10 @@ class RiskManager:
             "positions_count": self.state.positions_count,
             "current_exposure": self.state.current_exposure_usd,
             "in_cooldown": self.state.in_cooldown,
-            "limits": {
-                "max_position_size": self.limits.max_position_size_usd,
-                "max_daily_loss": self.limits.max_daily_loss_usd,
-                "max_positions": self.limits.max_concurrent_positions
-            }
+            "limits": self._limits_view
         }
 
     def get_trade_history(self, limit: int = 20) -> List[Dict]:
         """Get recent trade history."""
-        return self._trade_history[-limit:]
+        start = max(0, len(self._trade_history) - limit)
+        return [r.to_dict() for r in islice(self._trade_history, start, None)]
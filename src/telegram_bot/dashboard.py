@@ -3,10 +3,13 @@ Real-time dashboard updates for Telegram.
 """
 
 import asyncio
+import time
 from datetime import datetime
 from typing import Optional, Dict
 from loguru import logger
 
+from .keyboard import get_main_keyboard
+
 
 class Dashboard:
     """
@@ -19,21 +22,33 @@ class Dashboard:
     - Signal alerts
     """
 
-    def __init__(self, bot, chat_id: int, update_interval: float = 10.0):
+    def __init__(
+        self,
+        bot,
+        chat_id: int,
+        update_interval: float = 10.0,
+        min_update_interval: float = 1.0
+    ):
         """
         Initialize dashboard.
 
         Args:
             bot: TelegramBot instance
             chat_id: Chat ID to update
-            update_interval: Seconds between updates
+            update_interval: Maximum seconds between updates
+            min_update_interval: Minimum seconds between updates, so bursts
+                of mark_dirty() calls coalesce into one edit
         """
         self.bot = bot
         self.chat_id = chat_id
         self.update_interval = update_interval
+        self.min_update_interval = min_update_interval
 
         self._message_id: Optional[int] = None
         self._running = False
+        self._last_text_hash: int = 0
+        self._dirty = asyncio.Event()
+        self._last_update_mono = float("-inf")
 
     async def start(self) -> None:
         """Start dashboard updates."""
@@ -42,63 +57,92 @@ class Dashboard:
         # Send initial dashboard
         try:
             dashboard_text = await self.bot.handlers.get_dashboard()
-            from .keyboard import get_main_keyboard
             message = await self.bot.bot.send_message(
                 self.chat_id,
                 dashboard_text,
                 reply_markup=get_main_keyboard()
             )
             self._message_id = message.message_id
+            self._last_text_hash = hash(dashboard_text)
+            self._last_update_mono = time.monotonic()
         except Exception as e:
             logger.error(f"Failed to send initial dashboard: {e}")
             return
 
+        # Refresh as soon as new prices arrive rather than on the next interval
+        price_manager = self.bot.handlers.price_manager
+        if price_manager:
+            price_manager.add_price_callback(self._on_price_update)
+
         # Start update loop
         asyncio.create_task(self._update_loop())
 
     async def stop(self) -> None:
         """Stop dashboard updates."""
         self._running = False
+        self._dirty.set()
+
+    def mark_dirty(self) -> None:
+        """Signal that dashboard data changed (prices, positions, signals)."""
+        self._dirty.set()
+
+    def _on_price_update(self, symbol: str, price_data) -> None:
+        """Price callback: mark the dashboard dirty while it is running."""
+        if self._running:
+            self.mark_dirty()
 
     async def _update_loop(self) -> None:
-        """Update dashboard periodically."""
+        """Update dashboard when marked dirty, or every update_interval at most."""
         while self._running:
             try:
-                await asyncio.sleep(self.update_interval)
+                try:
+                    await asyncio.wait_for(self._dirty.wait(), timeout=self.update_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+                # Rate-limit edits to one per min_update_interval; changes
+                # arriving meanwhile are picked up by this pass
+                remaining = self._last_update_mono + self.min_update_interval - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                self._dirty.clear()
 
                 if not self._running:
                     break
+                self._last_update_mono = time.monotonic()
 
                 # Get updated dashboard
                 dashboard_text = await self.bot.handlers.get_dashboard()
 
                 # Update message
                 if self._message_id:
-                    from .keyboard import get_main_keyboard
-                    await self.bot.bot.edit_message_text(
-                        chat_id=self.chat_id,
-                        message_id=self._message_id,
-                        text=dashboard_text,
-                        reply_markup=get_main_keyboard()
-                    )
+                    await self._edit_if_changed(dashboard_text)
 
             except Exception as e:
                 # Message edit fails if content hasn't changed
                 if "message is not modified" not in str(e).lower():
                     logger.error(f"Dashboard update error: {e}")
 
+    async def _edit_if_changed(self, dashboard_text: str) -> None:
+        """Edit the dashboard message, skipping the API call if the text is unchanged."""
+        text_hash = hash(dashboard_text)
+        if text_hash == self._last_text_hash:
+            return
+
+        await self.bot.bot.edit_message_text(
+            chat_id=self.chat_id,
+            message_id=self._message_id,
+            text=dashboard_text,
+            reply_markup=get_main_keyboard()
+        )
+        self._last_text_hash = text_hash
+
     async def force_update(self) -> None:
         """Force an immediate dashboard update."""
         if self._message_id:
             try:
                 dashboard_text = await self.bot.handlers.get_dashboard()
-                from .keyboard import get_main_keyboard
-                await self.bot.bot.edit_message_text(
-                    chat_id=self.chat_id,
-                    message_id=self._message_id,
-                    text=dashboard_text,
-                    reply_markup=get_main_keyboard()
-                )
+                await self._edit_if_changed(dashboard_text)
             except Exception as e:
                 if "message is not modified" not in str(e).lower():
                     logger.error(f"Force update error: {e}")
@@ -2,10 +2,104 @@
 Telegram Bot command handlers.
 """
 
-from datetime import datetime
-from typing import Optional, Dict, Any
+import time
+from dataclasses import dataclass
+from functools import wraps
+from typing import Optional, Dict, Any, Tuple, Callable, Awaitable
 from loguru import logger
 
+from ..utils.clock import now_ns
+from ..utils.helpers import mask_private_key
+
+
+# Symbols shown in price views, in display order
+_SYMBOLS: Tuple[str, ...] = ("BTC", "ETH", "SOL", "XRP")
+
+# Per-symbol fixed lines
+_SYMBOL_HEADERS: Dict[str, str] = {symbol: f"<b>{symbol}:</b>" for symbol in _SYMBOLS}
+_SYMBOL_NO_DATA: Dict[str, str] = {symbol: f"  {symbol}: No data" for symbol in _SYMBOLS}
+
+# Static view headers; the trailing newline stands in for the blank line
+# that follows each header once the lines are joined
+_DASH_HEADER = "<b>Polymarket Lag Trading Bot</b>\n"
+_PRICES_HEADER = "<b>Current Prices</b>\n"
+_POSITIONS_HEADER = "<b>Open Positions</b>\n"
+_STATS_HEADER = "<b>Performance Statistics</b>\n"
+_SIGNALS_HEADER = "<b>Recent Signals</b>\n"
+_STATUS_HEADER = "<b>System Status</b>\n"
+_SETTINGS_HEADER = "<b>Current Settings</b>\n"
+
+# One open position in the positions view, trailing blank line included
+_POSITION_TEMPLATE = (
+    "<b>{0.outcome}</b>\n"
+    "  Entry: {0.entry_price:.4f}\n"
+    "  Current: {0.current_price:.4f}\n"
+    "  Size: ${0.size:.2f}\n"
+    "  P&L: ${0.unrealized_pnl:.2f} ({0.unrealized_pnl_pct:+.1f}%)\n"
+)
+
+# One signal dict in the signals view; the block suffix adds the trailing blank line
+_SIGNAL_TEMPLATE = (
+    "<b>{symbol}</b> - {signal_type}\n"
+    "  Strength: {strength}\n"
+    "  Oracle: ${oracle_price:,.2f}\n"
+    "  Lag: {lag_seconds:.1f}s\n"
+    "  Confidence: {confidence:.1%}"
+)
+_SIGNAL_SUFFIX = "\n"
+_ACTIONABLE_SIGNAL_SUFFIX = "\n  <b>ACTIONABLE</b>\n"
+
+# Last "Updated" stamp rendered, as (epoch second, "HH:MM:SS")
+_updated_stamp: Tuple[int, str] = (-1, "")
+
+# How long a rendered view may be served from cache, in seconds
+_RENDER_TTL_SECONDS = 0.5
+
+
+def _updated_time() -> str:
+    """Get the current UTC time as HH:MM:SS, formatting it at most once per second."""
+    global _updated_stamp
+    second = now_ns() // 1_000_000_000
+    if second != _updated_stamp[0]:
+        _updated_stamp = (second, time.strftime("%H:%M:%S", time.gmtime(second)))
+    return _updated_stamp[1]
+
+
+def _cached_view(method: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """
+    Serve a rendered view from cache while component state is unchanged.
+
+    Entries expire after _RENDER_TTL_SECONDS, which also bounds staleness
+    of time-dependent fields such as price ages.
+    """
+    key = method.__name__
+
+    @wraps(method)
+    async def wrapper(self: "BotHandlers") -> str:
+        now = time.monotonic()
+        fp = self._fingerprint()
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > now and entry[2] == fp:
+            return entry[1]
+
+        text = await method(self)
+        self._cache[key] = (now + _RENDER_TTL_SECONDS, text, fp)
+        return text
+
+    return wrapper
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """
+    Component status read once and shared by the views rendered from it.
+
+    A field is None when its component is not set.
+    """
+    position_stats: Optional[Dict[str, Any]]
+    strategy_state: Optional[Dict[str, Any]]
+    risk_status: Optional[Dict[str, Any]]
+
 
 class BotHandlers:
     """
@@ -25,6 +119,47 @@ class BotHandlers:
         self.position_manager = None
         self.config = None
 
+        # Rendered views by method name: (expires_at, text, fingerprint)
+        self._cache: Dict[str, Tuple[float, str, Tuple]] = {}
+
+        # Rendered settings view: (config generation, text)
+        self._settings_cache: Optional[Tuple[int, str]] = None
+
+        # Last component snapshot: (expires_at, fingerprint, snapshot)
+        self._snapshot: Optional[Tuple[float, Tuple, SystemSnapshot]] = None
+
+    def _fingerprint(self) -> Tuple:
+        """Get a cheap fingerprint of the component state views are built from."""
+        state = self.strategy.state if self.strategy else None
+        return (
+            getattr(self.price_manager, "_rev", None),
+            getattr(self.position_manager, "_rev", None),
+            getattr(self.risk_manager, "_rev", None),
+            (state.is_active, state.is_trading_enabled, state.total_signals_generated) if state else None
+        )
+
+    def _system_snapshot(self) -> SystemSnapshot:
+        """
+        Get the component status, re-reading it only when it may have changed.
+
+        Returns:
+            Snapshot shared until the fingerprint changes or
+            _RENDER_TTL_SECONDS elapse
+        """
+        now = time.monotonic()
+        fp = self._fingerprint()
+        entry = self._snapshot
+        if entry is not None and entry[0] > now and entry[1] == fp:
+            return entry[2]
+
+        snapshot = SystemSnapshot(
+            position_stats=self.position_manager.get_statistics() if self.position_manager else None,
+            strategy_state=self.strategy.get_state() if self.strategy else None,
+            risk_status=self.risk_manager.get_status() if self.risk_manager else None
+        )
+        self._snapshot = (now + _RENDER_TTL_SECONDS, fp, snapshot)
+        return snapshot
+
     def set_components(
         self,
         price_manager=None,
@@ -41,68 +176,71 @@ class BotHandlers:
         self.risk_manager = risk_manager
         self.position_manager = position_manager
         self.config = config
+        self._cache.clear()
+        self._snapshot = None
+        self._settings_cache = None
 
+    @_cached_view
     async def get_dashboard(self) -> str:
         """Get formatted dashboard text."""
-        lines = ["<b>Polymarket Lag Trading Bot</b>", ""]
-
         # Status
         status = "ACTIVE" if (self.strategy and self.strategy.state.is_active) else "INACTIVE"
         trading = "ENABLED" if (self.strategy and self.strategy.state.is_trading_enabled) else "DISABLED"
-        lines.append(f"Status: {status} | Trading: {trading}")
-        lines.append("")
+
+        # Fixed leading lines are built in one list display
+        lines = [_DASH_HEADER, f"Status: {status} | Trading: {trading}", "\n<b>Oracle Prices:</b>"]
 
         # Prices
-        lines.append("<b>Oracle Prices:</b>")
         if self.price_manager:
-            for symbol in ["BTC", "ETH", "SOL", "XRP"]:
-                price_data = self.price_manager.get_oracle_price(symbol)
+            for symbol, (price_data, _, _) in self.price_manager.get_snapshot(_SYMBOLS).items():
                 if price_data:
                     age = price_data.age_seconds
                     lines.append(f"  {symbol}: ${price_data.price:,.2f} ({age:.0f}s ago)")
                 else:
-                    lines.append(f"  {symbol}: No data")
+                    lines.append(_SYMBOL_NO_DATA[symbol])
         else:
             lines.append("  Price manager not initialized")
-        lines.append("")
 
         # Positions
-        lines.append("<b>Positions:</b>")
-        if self.position_manager:
-            stats = self.position_manager.get_statistics()
-            lines.append(f"  Open: {stats['open_positions_count']}")
-            lines.append(f"  Exposure: ${stats['total_exposure_usd']:.2f}")
-            lines.append(f"  Unrealized P&L: ${stats['unrealized_pnl']:.2f}")
+        snapshot = self._system_snapshot()
+        lines.append("\n<b>Positions:</b>")
+        stats = snapshot.position_stats
+        if stats is not None:
+            lines.append(
+                f"  Open: {stats['open_positions_count']}\n"
+                f"  Exposure: ${stats['total_exposure_usd']:.2f}\n"
+                f"  Unrealized P&L: ${stats['unrealized_pnl']:.2f}"
+            )
         else:
             lines.append("  No position data")
-        lines.append("")
 
         # Performance
-        lines.append("<b>Today's Performance:</b>")
-        if self.risk_manager:
-            risk_status = self.risk_manager.get_status()
-            lines.append(f"  Trades: {risk_status['daily_trades']}")
-            lines.append(f"  P&L: ${risk_status['daily_pnl']:.2f}")
+        lines.append("\n<b>Today's Performance:</b>")
+        risk_status = snapshot.risk_status
+        if risk_status is not None:
+            lines.append(
+                f"  Trades: {risk_status['daily_trades']}\n"
+                f"  P&L: ${risk_status['daily_pnl']:.2f}"
+            )
         else:
             lines.append("  No performance data")
 
-        lines.append("")
-        lines.append(f"<i>Updated: {datetime.utcnow().strftime('%H:%M:%S')} UTC</i>")
+        lines.append(f"\n<i>Updated: {_updated_time()} UTC</i>")
 
         return "\n".join(lines)
 
+    @_cached_view
     async def get_prices(self) -> str:
         """Get formatted price information."""
-        lines = ["<b>Current Prices</b>", ""]
+        lines = [_PRICES_HEADER]
 
         if not self.price_manager:
             return "Price manager not initialized"
 
-        for symbol in ["BTC", "ETH", "SOL", "XRP"]:
-            lines.append(f"<b>{symbol}:</b>")
+        for symbol, (oracle, pm, lag) in self.price_manager.get_snapshot(_SYMBOLS).items():
+            lines.append(_SYMBOL_HEADERS[symbol])
 
             # Oracle price
-            oracle = self.price_manager.get_oracle_price(symbol)
             if oracle:
                 lines.append(f"  Oracle: ${oracle.price:,.2f}")
                 lines.append(f"  Age: {oracle.age_seconds:.1f}s")
@@ -110,18 +248,16 @@ class BotHandlers:
                 lines.append("  Oracle: No data")
 
             # Polymarket implied price
-            pm = self.price_manager.get_polymarket_price(symbol)
             if pm:
                 lines.append(f"  Polymarket: ${pm.price:,.2f}")
             else:
                 lines.append("  Polymarket: No data")
 
             # Lag
-            lag = self.price_manager.get_price_lag(symbol)
             if lag:
                 lines.append(f"  Lag: {lag.lag_seconds:.1f}s ({lag.price_difference_pct:+.2f}%)")
                 if lag.is_profitable:
-                    lines.append(f"  <b>OPPORTUNITY!</b>")
+                    lines.append("  <b>OPPORTUNITY!</b>")
 
             lines.append("")
 
@@ -137,58 +273,59 @@ class BotHandlers:
         if not positions:
             return "<b>No Open Positions</b>"
 
-        lines = ["<b>Open Positions</b>", ""]
+        lines = [_POSITIONS_HEADER]
+        lines.extend(map(_POSITION_TEMPLATE.format, positions))
 
-        for pos in positions:
-            lines.append(f"<b>{pos.outcome}</b>")
-            lines.append(f"  Entry: {pos.entry_price:.4f}")
-            lines.append(f"  Current: {pos.current_price:.4f}")
-            lines.append(f"  Size: ${pos.size:.2f}")
-            lines.append(f"  P&L: ${pos.unrealized_pnl:.2f} ({pos.unrealized_pnl_pct:+.1f}%)")
-            lines.append("")
-
-        stats = self.position_manager.get_statistics()
-        lines.append(f"<b>Total:</b>")
+        stats = self._system_snapshot().position_stats
+        lines.append("<b>Total:</b>")
         lines.append(f"  Exposure: ${stats['total_exposure_usd']:.2f}")
         lines.append(f"  Unrealized P&L: ${stats['unrealized_pnl']:.2f}")
 
         return "\n".join(lines)
 
+    @_cached_view
     async def get_statistics(self) -> str:
         """Get formatted performance statistics."""
-        lines = ["<b>Performance Statistics</b>", ""]
+        lines = [_STATS_HEADER]
+
+        snapshot = self._system_snapshot()
 
         # Position stats
-        if self.position_manager:
-            stats = self.position_manager.get_statistics()
-            lines.append("<b>Trading:</b>")
-            lines.append(f"  Total Trades: {stats['total_trades']}")
-            lines.append(f"  Winning: {stats['winning_trades']}")
-            lines.append(f"  Losing: {stats['losing_trades']}")
-            lines.append(f"  Win Rate: {stats['win_rate']:.1f}%")
-            lines.append(f"  Total P&L: ${stats['total_pnl']:.2f}")
-            lines.append("")
+        stats = snapshot.position_stats
+        if stats is not None:
+            lines.append(
+                "<b>Trading:</b>\n"
+                f"  Total Trades: {stats['total_trades']}\n"
+                f"  Winning: {stats['winning_trades']}\n"
+                f"  Losing: {stats['losing_trades']}\n"
+                f"  Win Rate: {stats['win_rate']:.1f}%\n"
+                f"  Total P&L: ${stats['total_pnl']:.2f}\n"
+            )
 
         # Strategy stats
-        if self.strategy:
-            state = self.strategy.get_state()
-            lines.append("<b>Strategy:</b>")
-            lines.append(f"  Signals Generated: {state['total_signals']}")
-            lines.append(f"  Actionable: {state['actionable_signals']}")
-            lines.append("")
+        state = snapshot.strategy_state
+        if state is not None:
+            lines.append(
+                "<b>Strategy:</b>\n"
+                f"  Signals Generated: {state['total_signals']}\n"
+                f"  Actionable: {state['actionable_signals']}\n"
+            )
 
         # Risk stats
-        if self.risk_manager:
-            risk = self.risk_manager.get_status()
-            lines.append("<b>Risk:</b>")
-            lines.append(f"  Daily P&L: ${risk['daily_pnl']:.2f}")
-            lines.append(f"  Daily Trades: {risk['daily_trades']}")
-            lines.append(f"  Can Trade: {'Yes' if risk['can_trade'] else 'No'}")
+        risk = snapshot.risk_status
+        if risk is not None:
+            lines.append(
+                "<b>Risk:</b>\n"
+                f"  Daily P&L: ${risk['daily_pnl']:.2f}\n"
+                f"  Daily Trades: {risk['daily_trades']}\n"
+                f"  Can Trade: {'Yes' if risk['can_trade'] else 'No'}"
+            )
             if not risk['can_trade']:
                 lines.append(f"  Reason: {risk['reason']}")
 
         return "\n".join(lines)
 
+    @_cached_view
     async def get_recent_signals(self) -> str:
         """Get recent trading signals."""
         if not self.strategy:
@@ -199,80 +336,85 @@ class BotHandlers:
         if not signals:
             return "<b>No Recent Signals</b>"
 
-        lines = ["<b>Recent Signals</b>", ""]
+        lines = [_SIGNALS_HEADER]
 
         for sig in signals:
-            lines.append(f"<b>{sig['symbol']}</b> - {sig['signal_type']}")
-            lines.append(f"  Strength: {sig['strength']}")
-            lines.append(f"  Oracle: ${sig['oracle_price']:,.2f}")
-            lines.append(f"  Lag: {sig['lag_seconds']:.1f}s")
-            lines.append(f"  Confidence: {sig['confidence']:.1%}")
-            if sig['is_actionable']:
-                lines.append(f"  <b>ACTIONABLE</b>")
-            lines.append("")
+            suffix = _ACTIONABLE_SIGNAL_SUFFIX if sig['is_actionable'] else _SIGNAL_SUFFIX
+            lines.append(_SIGNAL_TEMPLATE.format_map(sig) + suffix)
 
         return "\n".join(lines)
 
+    @_cached_view
     async def get_status(self) -> str:
         """Get system status."""
-        lines = ["<b>System Status</b>", ""]
+        lines = [_STATUS_HEADER, "<b>Price Feeds:</b>"]
 
         # Price feeds
-        lines.append("<b>Price Feeds:</b>")
         if self.price_manager:
             status = self.price_manager.get_feed_status()
-            lines.append(f"  Scraper: {'Active' if status['scraper_active'] else 'Inactive'}")
-            lines.append(f"  On-chain: {'Ready' if status['onchain_active'] else 'Not ready'}")
+            lines.append(
+                f"  Scraper: {'Active' if status['scraper_active'] else 'Inactive'}\n"
+                f"  On-chain: {'Ready' if status['onchain_active'] else 'Not ready'}"
+            )
         else:
             lines.append("  Not initialized")
-        lines.append("")
 
         # Markets
-        lines.append("<b>Market Monitor:</b>")
+        lines.append("\n<b>Market Monitor:</b>")
         if self.market_monitor:
             market_status = self.market_monitor.get_all_market_status()
             for symbol, data in market_status.items():
                 lines.append(f"  {symbol}: {data['market_count']} markets")
         else:
             lines.append("  Not initialized")
-        lines.append("")
 
         # Strategy
-        lines.append("<b>Strategy:</b>")
-        if self.strategy:
-            state = self.strategy.get_state()
-            lines.append(f"  Active: {state['is_active']}")
-            lines.append(f"  Trading: {state['is_trading_enabled']}")
+        lines.append("\n<b>Strategy:</b>")
+        state = self._system_snapshot().strategy_state
+        if state is not None:
+            lines.append(
+                f"  Active: {state['is_active']}\n"
+                f"  Trading: {state['is_trading_enabled']}"
+            )
         else:
             lines.append("  Not initialized")
 
         return "\n".join(lines)
 
     async def get_settings(self) -> str:
-        """Get current settings."""
-        lines = ["<b>Current Settings</b>", ""]
+        """Get current settings, re-rendering only after the config changes."""
+        generation = getattr(self.config, "generation", None)
+        cached = self._settings_cache
+        if generation is not None and cached is not None and cached[0] == generation:
+            return cached[1]
+
+        lines = [_SETTINGS_HEADER]
 
         if self.config:
-            lines.append("<b>Trading:</b>")
-            lines.append(f"  Max Position: ${self.config.max_position_size_usd:.2f}")
-            lines.append(f"  Min Profit: {self.config.min_profit_threshold_pct:.1f}%")
-            lines.append(f"  Lag Threshold: {self.config.lag_threshold_seconds:.1f}s")
-            lines.append("")
-            lines.append("<b>Risk:</b>")
-            lines.append(f"  Max Daily Loss: ${self.config.max_daily_loss_usd:.2f}")
-            lines.append(f"  Max Positions: {self.config.max_concurrent_positions}")
-            lines.append(f"  Stop Loss: {self.config.stop_loss_pct:.1f}%")
-            lines.append("")
-            lines.append("<b>Wallet:</b>")
-            if self.config.polymarket_private_key:
-                masked = self.config.polymarket_private_key[:6] + "..." + self.config.polymarket_private_key[-4:]
-                lines.append(f"  Private Key: {masked}")
+            config = self.config
+            lines.append(
+                "<b>Trading:</b>\n"
+                f"  Max Position: ${config.max_position_size_usd:.2f}\n"
+                f"  Min Profit: {config.min_profit_threshold_pct:.1f}%\n"
+                f"  Lag Threshold: {config.lag_threshold_seconds:.1f}s\n"
+                "\n<b>Risk:</b>\n"
+                f"  Max Daily Loss: ${config.max_daily_loss_usd:.2f}\n"
+                f"  Max Positions: {config.max_concurrent_positions}\n"
+                f"  Stop Loss: {config.stop_loss_pct:.1f}%\n"
+                "\n<b>Wallet:</b>"
+            )
+            key = config.polymarket_private_key
+            if key:
+                lines.append(f"  Private Key: {mask_private_key(key)}")
             else:
                 lines.append("  Private Key: Not set")
         else:
             lines.append("Config not loaded")
 
-        return "\n".join(lines)
+        text = "\n".join(lines)
+        if generation is not None:
+            self._settings_cache = (generation, text)
+        return text
 
     async def start_trading(self) -> str:
         """Enable trading."""
@@ -291,7 +433,7 @@ class BotHandlers:
     async def save_wallet_config(self, private_key: str, funder_address: str) -> str:
         """Save wallet configuration."""
         # In production, this should save to encrypted storage
-        logger.info(f"Saving wallet config for address: {funder_address}")
+        logger.info("Saving wallet config for address: {}", funder_address)
 
         return (
             "Wallet configuration saved!\n\n"
@@ -1,10 +1,16 @@
 """
 Telegram keyboard layouts.
+
+Keyboards with fixed content are memoized: aiogram only reads them when
+serializing a reply, so one shared instance per layout is reused.
 """
 
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
 
+@lru_cache(maxsize=None)
 def get_main_keyboard() -> InlineKeyboardMarkup:
     """Get main dashboard keyboard."""
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
@@ -23,6 +29,7 @@ def get_main_keyboard() -> InlineKeyboardMarkup:
     return keyboard
 
 
+@lru_cache(maxsize=None)
 def get_settings_keyboard() -> InlineKeyboardMarkup:
     """Get settings keyboard."""
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
@@ -41,6 +48,7 @@ def get_settings_keyboard() -> InlineKeyboardMarkup:
     return keyboard
 
 
+@lru_cache(maxsize=16)
 def get_confirm_keyboard(action: str) -> InlineKeyboardMarkup:
     """Get confirmation keyboard."""
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
@@ -52,6 +60,7 @@ def get_confirm_keyboard(action: str) -> InlineKeyboardMarkup:
     return keyboard
 
 
+@lru_cache(maxsize=64)
 def get_position_keyboard(position_id: str) -> InlineKeyboardMarkup:
     """Get position management keyboard."""
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
@@ -65,6 +74,7 @@ def get_position_keyboard(position_id: str) -> InlineKeyboardMarkup:
     return keyboard
 
 
+@lru_cache(maxsize=2)
 def get_trading_keyboard(is_enabled: bool) -> InlineKeyboardMarkup:
     """Get trading control keyboard."""
     if is_enabled:
@@ -85,6 +95,7 @@ def get_trading_keyboard(is_enabled: bool) -> InlineKeyboardMarkup:
     return keyboard
 
 
+@lru_cache(maxsize=None)
 def get_back_keyboard() -> InlineKeyboardMarkup:
     """Get simple back keyboard."""
     keyboard = InlineKeyboardMarkup(inline_keyboard=[
@@ -0,0 +1,316 @@
+"""
+Telegram bot message and callback handlers.
+
+Handlers are module-level functions registered on Routers built by
+build_routers, rather than closures per TelegramBot instance. The
+dispatcher injects the shared BotHandlers instance and admin ID set as the
+``handlers`` and ``admin_ids`` keyword arguments (see TelegramBot.__init__).
+
+Admin access is enforced once by AdminFilter on the main router; updates
+from other users fall through to the unauthorized router.
+"""
+
+from typing import FrozenSet, Tuple, Union
+
+from aiogram import Router, F
+from aiogram.filters import Command, CommandStart, Filter
+from aiogram.types import Message, CallbackQuery
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State, StatesGroup
+
+from .handlers import BotHandlers
+from .keyboard import get_main_keyboard, get_settings_keyboard, get_confirm_keyboard
+from ..utils.helpers import validate_private_key, validate_address, mask_private_key
+
+
+# Static reply texts
+_WELCOME_TEXT = (
+    "Welcome to Polymarket In-Efficiency Bot!\n\n"
+    "This bot exploits the lag between Chainlink oracle prices "
+    "and Polymarket order book updates.\n\n"
+    "Use /help to see available commands."
+)
+
+_HELP_TEXT = """\
+<b>Available Commands:</b>
+
+<b>Dashboard:</b>
+/dashboard - Show live dashboard
+/prices - Show current prices
+/positions - Show open positions
+/stats - Show performance statistics
+
+<b>Trading:</b>
+/start_trading - Enable trading
+/stop_trading - Disable trading
+/signals - Show recent signals
+
+<b>Configuration:</b>
+/setup - Configure wallet and API keys
+/settings - View/edit settings
+/limits - View/edit risk limits
+
+<b>System:</b>
+/status - Bot status
+/logs - Recent logs
+/restart - Restart components
+"""
+
+_SETUP_PROMPT = (
+    "<b>Wallet Setup</b>\n\n"
+    "Please enter your Polymarket wallet private key.\n"
+    "You can export this from Polymarket.com:\n"
+    "Cash -> (...) -> Export Private Key\n\n"
+    "<i>Your key will be stored securely.</i>"
+)
+
+_FUNDER_PROMPT = (
+    "Private key saved.\n\n"
+    "Now enter your funder address (the wallet that holds your funds).\n"
+    "This is your Polygon wallet address."
+)
+
+
+class SetupStates(StatesGroup):
+    """States for bot setup wizard."""
+    waiting_private_key = State()
+    waiting_funder_address = State()
+    confirm_setup = State()
+
+
+class AdminFilter(Filter):
+    """Pass only updates sent by a configured admin."""
+
+    async def __call__(self, event: Union[Message, CallbackQuery], admin_ids: FrozenSet[int]) -> bool:
+        return event.from_user is not None and event.from_user.id in admin_ids
+
+
+# Replies for non-admins
+async def unauthorized_start(message: Message):
+    await message.answer("Unauthorized. This bot is private.")
+
+
+async def unauthorized_callback(callback: CallbackQuery):
+    await callback.answer("Unauthorized")
+
+
+# Start command
+async def start_handler(message: Message):
+    await message.answer(_WELCOME_TEXT, reply_markup=get_main_keyboard())
+
+
+# Help command
+async def help_handler(message: Message):
+    await message.answer(_HELP_TEXT)
+
+
+# Dashboard command
+async def dashboard_handler(message: Message, handlers: BotHandlers):
+    dashboard = await handlers.get_dashboard()
+    await message.answer(dashboard, reply_markup=get_main_keyboard())
+
+
+# Prices command
+async def prices_handler(message: Message, handlers: BotHandlers):
+    prices = await handlers.get_prices()
+    await message.answer(prices)
+
+
+# Positions command
+async def positions_handler(message: Message, handlers: BotHandlers):
+    positions = await handlers.get_positions()
+    await message.answer(positions)
+
+
+# Stats command
+async def stats_handler(message: Message, handlers: BotHandlers):
+    stats = await handlers.get_statistics()
+    await message.answer(stats)
+
+
+# Signals command
+async def signals_handler(message: Message, handlers: BotHandlers):
+    signals = await handlers.get_recent_signals()
+    await message.answer(signals)
+
+
+# Start trading command
+async def start_trading_handler(message: Message):
+    await message.answer(
+        "Are you sure you want to enable live trading?",
+        reply_markup=get_confirm_keyboard("enable_trading")
+    )
+
+
+# Stop trading command
+async def stop_trading_handler(message: Message, handlers: BotHandlers):
+    result = await handlers.stop_trading()
+    await message.answer(result)
+
+
+# Status command
+async def status_handler(message: Message, handlers: BotHandlers):
+    status = await handlers.get_status()
+    await message.answer(status)
+
+
+# Settings command
+async def settings_handler(message: Message, handlers: BotHandlers):
+    settings = await handlers.get_settings()
+    await message.answer(settings, reply_markup=get_settings_keyboard())
+
+
+# Setup command
+async def setup_handler(message: Message, state: FSMContext):
+    await message.answer(_SETUP_PROMPT)
+    await state.set_state(SetupStates.waiting_private_key)
+
+
+# Handle private key input
+async def handle_private_key(message: Message, state: FSMContext):
+    private_key = message.text.strip()
+
+    # Delete message with key for security
+    await message.delete()
+
+    # Validate key format
+    if not validate_private_key(private_key):
+        await message.answer(
+            "Invalid private key format. Please enter a valid key starting with 0x."
+        )
+        return
+
+    await state.update_data(private_key=private_key)
+
+    await message.answer(_FUNDER_PROMPT)
+    await state.set_state(SetupStates.waiting_funder_address)
+
+
+# Handle funder address input
+async def handle_funder_address(message: Message, state: FSMContext):
+    funder_address = message.text.strip()
+
+    # Validate address format
+    if not validate_address(funder_address):
+        await message.answer(
+            "Invalid address format. Please enter a valid Ethereum address."
+        )
+        return
+
+    await state.update_data(funder_address=funder_address)
+
+    data = await state.get_data()
+    masked_key = mask_private_key(data["private_key"])
+
+    await message.answer(
+        f"<b>Confirm Setup</b>\n\n"
+        f"Private Key: {masked_key}\n"
+        f"Funder Address: {funder_address}\n\n"
+        f"Confirm this configuration?",
+        reply_markup=get_confirm_keyboard("confirm_setup")
+    )
+    await state.set_state(SetupStates.confirm_setup)
+
+
+# Callback query handlers
+async def handle_confirm(callback: CallbackQuery, state: FSMContext, handlers: BotHandlers):
+    action = callback.data.replace("confirm_", "")
+
+    if action == "setup_yes":
+        data = await state.get_data()
+        result = await handlers.save_wallet_config(
+            data.get("private_key", ""),
+            data.get("funder_address", "")
+        )
+        await callback.message.edit_text(result)
+        await state.clear()
+
+    elif action == "setup_no":
+        await callback.message.edit_text("Setup cancelled.")
+        await state.clear()
+
+    elif action == "enable_trading_yes":
+        result = await handlers.start_trading()
+        await callback.message.edit_text(result)
+
+    elif action.endswith("_no"):
+        await callback.message.edit_text("Action cancelled.")
+
+    await callback.answer()
+
+
+# Dashboard refresh callback
+async def refresh_dashboard(callback: CallbackQuery, handlers: BotHandlers):
+    dashboard = await handlers.get_dashboard()
+    await callback.message.edit_text(dashboard, reply_markup=get_main_keyboard())
+    await callback.answer("Dashboard refreshed")
+
+
+# Button handlers
+async def btn_prices(callback: CallbackQuery, handlers: BotHandlers):
+    prices = await handlers.get_prices()
+    await callback.message.answer(prices)
+    await callback.answer()
+
+
+async def btn_positions(callback: CallbackQuery, handlers: BotHandlers):
+    positions = await handlers.get_positions()
+    await callback.message.answer(positions)
+    await callback.answer()
+
+
+async def btn_signals(callback: CallbackQuery, handlers: BotHandlers):
+    signals = await handlers.get_recent_signals()
+    await callback.message.answer(signals)
+    await callback.answer()
+
+
+async def btn_stats(callback: CallbackQuery, handlers: BotHandlers):
+    stats = await handlers.get_statistics()
+    await callback.message.answer(stats)
+    await callback.answer()
+
+
+def build_routers() -> Tuple[Router, Router]:
+    """
+    Build a fresh pair of routers with all handlers registered.
+
+    aiogram routers can be attached to only one parent, so every
+    TelegramBot builds its own.
+
+    Returns:
+        Tuple of (admin router, unauthorized router), to be included in that order
+    """
+    router = Router(name="bot")
+    router.message.filter(AdminFilter())
+    router.callback_query.filter(AdminFilter())
+
+    router.message.register(start_handler, CommandStart())
+    router.message.register(help_handler, Command("help"))
+    router.message.register(dashboard_handler, Command("dashboard"))
+    router.message.register(prices_handler, Command("prices"))
+    router.message.register(positions_handler, Command("positions"))
+    router.message.register(stats_handler, Command("stats"))
+    router.message.register(signals_handler, Command("signals"))
+    router.message.register(start_trading_handler, Command("start_trading"))
+    router.message.register(stop_trading_handler, Command("stop_trading"))
+    router.message.register(status_handler, Command("status"))
+    router.message.register(settings_handler, Command("settings"))
+    router.message.register(setup_handler, Command("setup"))
+    router.message.register(handle_private_key, SetupStates.waiting_private_key)
+    router.message.register(handle_funder_address, SetupStates.waiting_funder_address)
+    router.callback_query.register(handle_confirm, F.data.startswith("confirm_"))
+    router.callback_query.register(refresh_dashboard, F.data == "refresh_dashboard")
+    router.callback_query.register(btn_prices, F.data == "btn_prices")
+    router.callback_query.register(btn_positions, F.data == "btn_positions")
+    router.callback_query.register(btn_signals, F.data == "btn_signals")
+    router.callback_query.register(btn_stats, F.data == "btn_stats")
+
+    unauthorized_router = Router(name="unauthorized")
+    unauthorized_router.message.register(unauthorized_start, CommandStart())
+    unauthorized_router.callback_query.register(
+        unauthorized_callback,
+        F.data.startswith("confirm_") | (F.data == "refresh_dashboard")
+    )
+
+    return router, unauthorized_router
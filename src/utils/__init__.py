@@ -4,11 +4,19 @@ Utility functions and helpers.
 
 from .logger import setup_logging, get_logger
 from .helpers import format_price, format_percentage, format_timestamp
+from .clock import now_ns, utcnow, ns_to_datetime, to_epoch_seconds, use_clock
+from .ids import gen_id
 
 __all__ = [
     "setup_logging",
     "get_logger",
     "format_price",
     "format_percentage",
-    "format_timestamp"
+    "format_timestamp",
+    "now_ns",
+    "utcnow",
+    "ns_to_datetime",
+    "to_epoch_seconds",
+    "use_clock",
+    "gen_id"
 ]
@@ -0,0 +1,52 @@
+"""
+Clock helpers with an overridable time source.
+
+Tests and backtests can swap the time source for the current context
+(e.g. to replay recorded event timestamps) instead of monkeypatching datetime.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Callable, Iterator
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+_now_ns_var: ContextVar[Callable[[], int]] = ContextVar("_now_ns", default=time.time_ns)
+
+
+def now_ns() -> int:
+    """Get the current time in nanoseconds since the epoch."""
+    return _now_ns_var.get()()
+
+
+def utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime (like datetime.utcnow)."""
+    return _EPOCH + timedelta(microseconds=_now_ns_var.get()() // 1000)
+
+
+def ns_to_datetime(ns: int) -> datetime:
+    """Convert nanoseconds since the epoch to a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def to_epoch_seconds(dt: datetime) -> float:
+    """Convert a naive UTC datetime to float seconds since the epoch."""
+    return (dt - _EPOCH).total_seconds()
+
+
+@contextmanager
+def use_clock(now_ns_fn: Callable[[], int]) -> Iterator[None]:
+    """
+    Use a custom time source within the current context.
+
+    Args:
+        now_ns_fn: Callable returning nanoseconds since the epoch
+    """
+    token = _now_ns_var.set(now_ns_fn)
+    try:
+        yield
+    finally:
+        _now_ns_var.reset(token)
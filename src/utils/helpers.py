@@ -2,18 +2,29 @@
 Helper utility functions.
 """
 
+import re
 from datetime import datetime
 from typing import Optional
 
 
+# "0x"-prefixed hex of a fixed byte length
+_PRIVATE_KEY_RE = re.compile(r"0x[0-9a-fA-F]{64}")
+_ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+# Duration display units as (seconds per unit, suffix)
+_DURATION_UNITS = ((1, "s"), (60, "m"), (3600, "h"))
+
+
 def format_price(price: float, decimals: int = 2) -> str:
     """Format price with commas and decimals."""
+    if price < 1:
+        return f"${price:.4f}"
+    if decimals == 2:
+        # Common case: static format specs, no nested spec to build
+        return f"${price:,.2f}" if price >= 1000 else f"${price:.2f}"
     if price >= 1000:
         return f"${price:,.{decimals}f}"
-    elif price >= 1:
-        return f"${price:.{decimals}f}"
-    else:
-        return f"${price:.4f}"
+    return f"${price:.{decimals}f}"
 
 
 def format_percentage(value: float, include_sign: bool = True) -> str:
@@ -32,14 +43,8 @@ def format_timestamp(dt: datetime, include_date: bool = False) -> str:
 
 def format_duration(seconds: float) -> str:
     """Format duration in human readable format."""
-    if seconds < 60:
-        return f"{seconds:.1f}s"
-    elif seconds < 3600:
-        minutes = seconds / 60
-        return f"{minutes:.1f}m"
-    else:
-        hours = seconds / 3600
-        return f"{hours:.1f}h"
+    divisor, unit = _DURATION_UNITS[0 if seconds < 60 else 1 if seconds < 3600 else 2]
+    return f"{seconds / divisor:.1f}{unit}"
 
 
 def truncate_string(s: str, max_length: int = 50, suffix: str = "...") -> str:
@@ -53,14 +58,14 @@ def mask_private_key(key: str) -> str:
     """Mask private key for display."""
     if not key or len(key) < 10:
         return "***"
-    return key[:6] + "..." + key[-4:]
+    return f"{key[:6]}...{key[-4:]}"
 
 
 def mask_address(address: str) -> str:
     """Mask wallet address for display."""
     if not address or len(address) < 10:
         return "***"
-    return address[:6] + "..." + address[-4:]
+    return f"{address[:6]}...{address[-4:]}"
 
 
 def calculate_pnl_percentage(entry_price: float, current_price: float, side: str) -> float:
@@ -76,29 +81,9 @@ def calculate_pnl_percentage(entry_price: float, current_price: float, side: str
 
 def validate_private_key(key: str) -> bool:
     """Validate private key format."""
-    if not key:
-        return False
-    if not key.startswith("0x"):
-        return False
-    if len(key) != 66:
-        return False
-    try:
-        int(key, 16)
-        return True
-    except ValueError:
-        return False
+    return bool(key) and _PRIVATE_KEY_RE.fullmatch(key) is not None
 
 
 def validate_address(address: str) -> bool:
     """Validate Ethereum address format."""
-    if not address:
-        return False
-    if not address.startswith("0x"):
-        return False
-    if len(address) != 42:
-        return False
-    try:
-        int(address, 16)
-        return True
-    except ValueError:
-        return False
+    return bool(address) and _ADDRESS_RE.fullmatch(address) is not None
@@ -0,0 +1,26 @@
+"""
+Cheap unique identifiers for trade actions and positions.
+
+IDs combine a random per-process nonce with a monotonic counter, which is
+unique within the process and across restarts without calling uuid4().
+"""
+
+import secrets
+from itertools import count
+
+
+_NONCE = secrets.token_hex(4)
+_counter = count()
+
+
+def gen_id(prefix: str) -> str:
+    """
+    Generate a unique identifier.
+
+    Args:
+        prefix: Short tag for the kind of object (e.g. "act", "pos")
+
+    Returns:
+        Identifier of the form "<prefix>-<nonce>-<counter hex>"
+    """
+    return f"{prefix}-{_NONCE}-{next(_counter):x}"
@@ -4,14 +4,31 @@ Logging configuration using loguru.
 
 import sys
 from pathlib import Path
+from typing import Optional, Set
 from loguru import logger
 
 
+# Log files whose parent directory is known to exist
+_log_dirs_ready: Set[str] = set()
+
+
+def _ensure_log_dir(log_file: str) -> None:
+    """Create the parent directory of a log file unless it is known to exist."""
+    if log_file in _log_dirs_ready:
+        return
+
+    parent = Path(log_file).parent
+    if not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
+    _log_dirs_ready.add(log_file)
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: str = "./logs/bot.log",
     rotation: str = "10 MB",
-    retention: str = "7 days"
+    retention: str = "7 days",
+    json_log_file: Optional[str] = None
 ) -> None:
     """
     Setup logging configuration.
@@ -21,11 +38,12 @@ def setup_logging(
         log_file: Path to log file
         rotation: Log rotation size
         retention: Log retention period
+        json_log_file: Optional path for a structured (JSON lines) log file
     """
     # Remove default handler
     logger.remove()
 
-    # Console handler with colors
+    # Console handler with colors, written from the background worker
     logger.add(
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
@@ -33,22 +51,39 @@ def setup_logging(
                "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
                "<level>{message}</level>",
         level=log_level,
-        colorize=True
+        colorize=True,
+        enqueue=True
     )
 
     # File handler
-    log_path = Path(log_file)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_log_dir(log_file)
 
+    # Writes go through a background thread so disk I/O and rotation
+    # don't block the event loop
     logger.add(
         log_file,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} | {message}",
         level=log_level,
         rotation=rotation,
         retention=retention,
-        compression="gz"
+        compression="gz",
+        colorize=False,
+        enqueue=True
     )
 
+    # Structured handler, serialized on the background worker like the file sink
+    if json_log_file:
+        _ensure_log_dir(json_log_file)
+        logger.add(
+            json_log_file,
+            level=log_level,
+            rotation=rotation,
+            retention=retention,
+            compression="gz",
+            serialize=True,
+            enqueue=True
+        )
+
     logger.info(f"Logging initialized (level={log_level}, file={log_file})")
 
 